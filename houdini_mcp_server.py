@@ -58,12 +58,18 @@ class HoudiniConnection:
     last_command_at: float = None
     command_count: int = 0
 
+    _HEADER_SIZE = 4  # each message is a big-endian uint32 length followed by a JSON payload
+
     def connect(self) -> bool:
         """Connect to the Houdini plugin (which is listening on self.host:self.port)."""
         if self.sock is not None:
             return True  # Already connected
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Back-to-back small commands: don't let Nagle hold one until the previous reply is ACKed
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The socket is reused for every command; notice if Houdini vanished without a FIN
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.sock.connect((self.host, self.port))
             self.connected_since = asyncio.get_event_loop().time()
             logger.info(f"Connected to Houdini at {self.host}:{self.port}")
@@ -110,14 +116,15 @@ class HoudiniConnection:
 
         try:
             # Send the command
-            self.sock.sendall(data_out)
+            self.sock.sendall(len(data_out).to_bytes(self._HEADER_SIZE, "big") + data_out)
             self.last_command_at = asyncio.get_event_loop().time()
             self.command_count += 1
             logger.info(f"Sent command to Houdini: {command}")
 
-            # Read response. We'll accumulate chunks until we can parse a full JSON.
+            # Read response. Accumulate chunks until the length-prefixed payload is complete.
             self.sock.settimeout(10.0)
-            buffer = b""
+            buffer = bytearray()
+            expected = None
             start_time = asyncio.get_event_loop().time()
             while True:
                 if asyncio.get_event_loop().time() - start_time > 10.0:
@@ -130,14 +137,16 @@ class HoudiniConnection:
                     else:
                          raise ConnectionAbortedError("Connection closed by Houdini before sending data.")
 
-                buffer += chunk
+                buffer.extend(chunk)
+                if expected is None and len(buffer) >= self._HEADER_SIZE:
+                    expected = self._HEADER_SIZE + int.from_bytes(buffer[:self._HEADER_SIZE], "big")
+                if expected is None or len(buffer) < expected:
+                    continue
                 try:
-                    decoded_string = buffer.decode("utf-8")
+                    decoded_string = buffer[self._HEADER_SIZE:expected].decode("utf-8")
                     parsed = json.loads(decoded_string)
                     logger.info(f"Received response from Houdini: {parsed}")
                     return parsed
-                except json.JSONDecodeError:
-                    continue
                 except UnicodeDecodeError:
                      logger.error("Received non-UTF-8 data from Houdini")
                      raise ValueError("Received non-UTF-8 data from Houdini")
@@ -234,13 +243,14 @@ def get_connection_status(ctx: Context) -> str:
     return json.dumps(_houdini_connection.get_status(), indent=2)
 
 @mcp.tool()
-def get_scene_info(ctx: Context) -> str:
+def get_scene_info(ctx: Context, include_node_count: bool = False) -> str:
     """
     Ask Houdini for scene info. Returns JSON as a string.
+    Set include_node_count=True to also count every node in the scene (walks the full tree).
     """
     try:
         conn = get_houdini_connection()
-        response = conn.send_command("get_scene_info")
+        response = conn.send_command("get_scene_info", {"include_node_count": include_node_count})
         if response.get("status") == "error":
             origin = response.get('origin', 'houdini')
             return f"Error ({origin}): {response.get('message', 'Unknown error')}"
@@ -320,9 +330,11 @@ def render_single_view(ctx: Context,
                        rotation: List[float] = [0, 90, 0],
                        render_path: str = None,
                        render_engine: str = "opengl",
-                       karma_engine: str = "cpu") -> str:
+                       karma_engine: str = "cpu",
+                       return_image: bool = True) -> str:
     """
     Render a single view inside Houdini and return the rendered image path.
+    Set return_image=False to skip the base64 payload when Houdini runs locally.
     """
     try:
         conn = get_houdini_connection()
@@ -332,6 +344,7 @@ def render_single_view(ctx: Context,
             "render_path": render_path or tempfile.gettempdir(),
             "render_engine": render_engine,
             "karma_engine": karma_engine,
+            "return_image": return_image,
         })
 
         if response.get("status") == "error":
@@ -347,9 +360,11 @@ def render_single_view(ctx: Context,
 def render_quad_views(ctx: Context,
                       render_path: str = None,
                       render_engine: str = "opengl",
-                      karma_engine: str = "cpu") -> str:
+                      karma_engine: str = "cpu",
+                      return_image: bool = True) -> str:
     """
     Render 4 canonical views from Houdini and return the image paths.
+    Set return_image=False to skip the base64 payloads when Houdini runs locally.
     """
     try:
         conn = get_houdini_connection()
@@ -357,6 +372,7 @@ def render_quad_views(ctx: Context,
             "render_path": render_path or tempfile.gettempdir(),
             "render_engine": render_engine,
             "karma_engine": karma_engine,
+            "return_image": return_image,
         })
 
         if response.get("status") == "error":
@@ -373,9 +389,11 @@ def render_specific_camera(ctx: Context,
                            camera_path: str,
                            render_path: str = None,
                            render_engine: str = "opengl",
-                           karma_engine: str = "cpu") -> str:
+                           karma_engine: str = "cpu",
+                           return_image: bool = True) -> str:
     """
     Render from a specific camera path in the Houdini scene.
+    Set return_image=False to skip the base64 payload when Houdini runs locally.
     """
     try:
         conn = get_houdini_connection()
@@ -384,6 +402,7 @@ def render_specific_camera(ctx: Context,
             "render_path": render_path or tempfile.gettempdir(),
             "render_engine": render_engine,
             "karma_engine": karma_engine,
+            "return_image": return_image,
         })
 
         if response.get("status") == "error":
@@ -418,9 +437,14 @@ def delete_node(ctx: Context, path: str) -> str:
     return _send_tool_command("delete_node", {"path": path})
 
 @mcp.tool()
-def get_node_info(ctx: Context, path: str) -> str:
-    """Get detailed info about a node: type, parameters, inputs, outputs."""
-    return _send_tool_command("get_node_info", {"path": path})
+def delete_nodes(ctx: Context, paths: List[str]) -> str:
+    """Delete several nodes in one call, batched per parent network."""
+    return _send_tool_command("delete_nodes", {"paths": paths})
+
+@mcp.tool()
+def get_node_info(ctx: Context, path: str, max_parms: int = 20) -> str:
+    """Get detailed info about a node: type, parameters (first max_parms), inputs, outputs."""
+    return _send_tool_command("get_node_info", {"path": path, "max_parms": max_parms})
 
 @mcp.tool()
 def set_material(ctx: Context, node_path: str, material_type: str = "principledshader",
@@ -528,9 +552,9 @@ def set_node_color(ctx: Context, node_path: str, color: List[float] = [1, 1, 1])
 # Error Detection
 # -------------------------------------------------------------------
 @mcp.tool()
-def find_error_nodes(ctx: Context, root_path: str = "/obj") -> str:
-    """Scan the node hierarchy for cook errors and warnings."""
-    return _send_tool_command("find_error_nodes", {"root_path": root_path})
+def find_error_nodes(ctx: Context, root_path: str = "/obj", max_results: int = 100) -> str:
+    """Scan the node hierarchy for cook errors and warnings (first max_results nodes)."""
+    return _send_tool_command("find_error_nodes", {"root_path": root_path, "max_results": max_results})
 
 
 # -------------------------------------------------------------------
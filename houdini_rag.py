@@ -10,20 +10,44 @@ Based on: https://github.com/orrzxz/Houdini21MCP
 import os
 import re
 import json
+import heapq
 import math
-from collections import Counter
+from collections import Counter, OrderedDict
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 DOCS_DIR = Path(os.environ.get("HOUDINIMCP_DOCS_DIR", SCRIPT_DIR / "houdini_docs"))
 INDEX_PATH = Path(os.environ.get("HOUDINIMCP_DOCS_INDEX", SCRIPT_DIR / "houdini_docs_index.json"))
+SEARCH_CACHE_SIZE = 256  # LLM clients repeat the same few queries ("box sop", "karma")
+
+# Compiled once: tokenize() runs over every document at build time and every query
+_HOU_CALL_RE = re.compile(r'hou\.\w+(?:\(\))?')             # hou.node, hou.parm, etc.
+_NODE_PATH_RE = re.compile(r'/\w+(?:/\w+)+')                 # /obj/geo1, /mat/shader
+_UNDERSCORE_RE = re.compile(r'\w+_\w+(?:_\w+)*')             # mtlxstandard_surface
+_WORD_RE = re.compile(r'[a-z0-9_]+')
+
+_WIKI_TITLE_RE = re.compile(r'^=\s*(.+?)\s*=', re.MULTILINE)   # = Box SOP =
+_MD_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)         # # Box SOP
+
+# (pattern, replacement) pairs for DocumentLoader.clean_content, compiled once per process
+_CLEAN_PATTERNS = [
+    (re.compile(r'^#\w+:.*$', re.MULTILINE), ''),      # #bestbet:, #type: directives
+    (re.compile(r':\w+:'), ' '),
+    (re.compile(r'\[Icon:[^\]]+\]'), ''),
+    (re.compile(r'\(\([^\)]+\)\)'), ''),
+    (re.compile(r'\[([^\]]+)\]\|[^\]]+\]'), r'\1'),
+    (re.compile(r'\[([^\]]+)\]\([^\)]+\)'), r'\1'),
+    (re.compile(r'```\w*\n?'), ''),
+    (re.compile(r'\n{3,}'), '\n\n'),
+    (re.compile(r' {2,}'), ' '),
+]
 
 
 class HoudiniTokenizer:
     """Tokenizer optimized for Houdini documentation.
     Preserves hou.* calls, node paths, and underscore compounds."""
 
-    STOPWORDS = {
+    STOPWORDS = frozenset({
         'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
         'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
         'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
@@ -34,29 +58,18 @@ class HoudiniTokenizer:
         'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
         'some', 'such', 'no', 'not', 'only', 'same', 'so', 'than', 'too',
         'very', 'just', 'also', 'now', 'here', 'there', 'any', 'many'
-    }
+    })
 
     def tokenize(self, text):
         text = text.lower()
-        preserved = []
+        # Preserved matches are appended after the plain words, as extra tokens
+        tokens = _WORD_RE.findall(text)
+        tokens.extend(_HOU_CALL_RE.findall(text))
+        tokens.extend(_NODE_PATH_RE.findall(text))
+        tokens.extend(_UNDERSCORE_RE.findall(text))
 
-        # hou.node, hou.parm, etc.
-        for match in re.finditer(r'hou\.\w+(?:\(\))?', text):
-            preserved.append(match.group())
-
-        # Node paths: /obj/geo1, /mat/shader
-        for match in re.finditer(r'/\w+(?:/\w+)+', text):
-            preserved.append(match.group())
-
-        # Underscore compounds: mtlxstandard_surface
-        for match in re.finditer(r'\w+_\w+(?:_\w+)*', text):
-            preserved.append(match.group())
-
-        # General tokenization
-        tokens = re.findall(r'[a-z0-9_]+', text)
-        tokens.extend(preserved)
-
-        return [t for t in tokens if t not in self.STOPWORDS and len(t) > 1]
+        stopwords = self.STOPWORDS
+        return [t for t in tokens if len(t) > 1 and t not in stopwords]
 
 
 class BM25Index:
@@ -72,6 +85,8 @@ class BM25Index:
         self.avgdl = 0
         self.idf = {}
         self.term_docs = {}
+        self.doc_norms = []
+        self._search_cache = OrderedDict()  # (query, top_k) -> results, LRU order
 
     def add_document(self, path, title, content):
         tokens = self.tokenizer.tokenize(content)
@@ -99,30 +114,52 @@ class BM25Index:
         for term, doc_indices in self.term_docs.items():
             df = len(doc_indices)
             self.idf[term] = math.log((n - df + 0.5) / (df + 0.5) + 1)
+        self._compute_doc_norms()
+        self._search_cache.clear()
+
+    def _compute_doc_norms(self):
+        """Precompute each document's length normalization term, k1 * (1 - b + b * dl / avgdl)."""
+        k1, b = self.k1, self.b
+        avgdl = self.avgdl or 1  # every document empty: no term can match anyway
+        self.doc_norms = [k1 * (1 - b + b * dl / avgdl) for dl in self.doc_lens]
 
     def search(self, query, top_k=5):
+        key = (query, top_k)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = self._search(query, top_k)
+            self._search_cache[key] = results
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+        # Callers get their own dicts so the cached results can't be mutated
+        return [dict(r) for r in results]
+
+    def _search(self, query, top_k):
         query_tokens = self.tokenizer.tokenize(query)
         if not query_tokens:
             return []
 
-        candidate_docs = set()
+        # Walk each query term's postings once instead of rescoring every candidate per term
+        scores = {}
+        k1_plus_1 = self.k1 + 1
         for term in query_tokens:
-            if term in self.term_docs:
-                candidate_docs.update(self.term_docs[term])
-
-        if not candidate_docs:
-            return []
-
-        scores = []
-        for doc_idx in candidate_docs:
-            score = self._score_document(doc_idx, query_tokens)
-            if score > 0:
-                scores.append((doc_idx, score))
+            doc_indices = self.term_docs.get(term)
+            if not doc_indices:
+                continue
+            idf = self.idf.get(term, 0)
+            for doc_idx in doc_indices:
+                tf = self.doc_freqs[doc_idx][term]
+                scores[doc_idx] = scores.get(doc_idx, 0) + (
+                    idf * (tf * k1_plus_1 / (tf + self.doc_norms[doc_idx])))
 
-        scores.sort(key=lambda x: -x[1])
+        top = heapq.nlargest(
+            top_k, ((doc_idx, score) for doc_idx, score in scores.items() if score > 0),
+            key=lambda item: item[1])
 
         results = []
-        for doc_idx, score in scores[:top_k]:
+        for doc_idx, score in top:
             doc = self.documents[doc_idx]
             results.append({
                 'path': doc['path'],
@@ -132,21 +169,6 @@ class BM25Index:
             })
         return results
 
-    def _score_document(self, doc_idx, query_tokens):
-        score = 0
-        doc_freq = self.doc_freqs[doc_idx]
-        dl = self.doc_lens[doc_idx]
-
-        for term in query_tokens:
-            if term not in doc_freq:
-                continue
-            tf = doc_freq[term]
-            idf = self.idf.get(term, 0)
-            numerator = tf * (self.k1 + 1)
-            denominator = tf + self.k1 * (1 - self.b + self.b * dl / self.avgdl)
-            score += idf * (numerator / denominator)
-        return score
-
     def save(self, path=None):
         path = Path(path) if path else INDEX_PATH
         data = {
@@ -160,7 +182,8 @@ class BM25Index:
             'term_docs': self.term_docs,
         }
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f)
+            # Compact separators: the index holds a tf dict per document and is mostly punctuation
+            json.dump(data, f, separators=(',', ':'))
 
     @classmethod
     def load(cls, path=None):
@@ -176,6 +199,7 @@ class BM25Index:
         index.avgdl = data['avgdl']
         index.idf = data['idf']
         index.term_docs = data['term_docs']
+        index._compute_doc_norms()
         return index
 
 
@@ -186,24 +210,18 @@ class DocumentLoader:
         self.docs_dir = Path(docs_dir) if docs_dir else DOCS_DIR
 
     def extract_title(self, content, filepath):
-        match = re.search(r'^=\s*(.+?)\s*=', content, re.MULTILINE)
+        match = _WIKI_TITLE_RE.search(content)
         if match:
             return match.group(1).strip()
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        match = _MD_TITLE_RE.search(content)
         if match:
             return match.group(1).strip()
         return filepath.stem.replace('_', ' ').title()
 
     def clean_content(self, content):
-        content = re.sub(r'^#\w+:.*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r':\w+:', ' ', content)
-        content = re.sub(r'\[Icon:[^\]]+\]', '', content)
-        content = re.sub(r'\(\([^\)]+\)\)', '', content)
-        content = re.sub(r'\[([^\]]+)\]\|[^\]]+\]', r'\1', content)
-        content = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', content)
-        content = re.sub(r'```\w*\n?', '', content)
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        content = re.sub(r' {2,}', ' ', content)
+        # Applied in order: later patterns rely on the earlier substitutions
+        for pattern, repl in _CLEAN_PATTERNS:
+            content = pattern.sub(repl, content)
         return content.strip()
 
     def load_all(self):
@@ -27,6 +27,7 @@ PLUGIN_FILES = [
     "src/houdinimcp/server.py",
     "src/houdinimcp/HoudiniMCPRender.py",
     "src/houdinimcp/claude_terminal.py",
+    "src/houdinimcp/claude_terminal_text.py",
     "src/houdinimcp/event_collector.py",
 ]
 HANDLER_DIR = "src/houdinimcp/handlers"
@@ -2,15 +2,17 @@ import numpy as np
 import math
 import os
 import tempfile
+import logging
 import hou
 
+logger = logging.getLogger(__name__)
+
 def find_displayed_geometry():
     """Find all displayed geometry nodes in the scene."""
     displayed_geo = []
     
     # Iterate through all objects in /obj
     for node in hou.node("/obj").children():
-        print(node.type().name())
         # Check if the node is a geometry node and is displayed
         if node.type().name() in ["geo", "subnet"] and node.isDisplayFlagSet():
             displayed_geo.append(node)
@@ -81,7 +83,7 @@ def calculate_bounding_box(nodes):
                         max_bounds[1] = max(max_bounds[1], transformed_point[1])
                         max_bounds[2] = max(max_bounds[2], transformed_point[2])
         except Exception as e:
-            print(f"Error processing node {node.name()}: {e}")
+            logger.warning("Error processing node %s: %s", node.name(), e)
             continue
     
     if np.isinf(min_bounds).any() or np.isinf(max_bounds).any():
@@ -146,10 +148,10 @@ def setup_camera_rig(bbox_center, orthographic=False):
     # Set projection type
     if orthographic:
         camera.parm("projection").set(1)  # 1 = Orthographic
-        print("Created orthographic camera")
+        logger.debug("Created orthographic camera")
     else:
         camera.parm("projection").set(0)  # 0 = Perspective
-        print("Created perspective camera")
+        logger.debug("Created perspective camera")
     
     # Make the camera a child of the null
     camera.setFirstInput(null)
@@ -165,7 +167,7 @@ def rotate_camera_center(null_node, rotation=(0, 90, 0)):
         rotation: Tuple of (rx, ry, rz) rotation angles in degrees
     """
     if not null_node:
-        print("No null node provided for rotation.")
+        logger.warning("No null node provided for rotation.")
         return
         
     try:
@@ -181,10 +183,10 @@ def rotate_camera_center(null_node, rotation=(0, 90, 0)):
         
         # Apply the rotation
         null_node.parmTuple("r").set(new_rotation)
-        print(f"Rotated camera center. New rotation: {new_rotation}")
+        logger.debug("Rotated camera center. New rotation: %s", new_rotation)
         
     except Exception as e:
-        print(f"Error rotating camera center: {e}")
+        logger.warning("Error rotating camera center: %s", e)
 
 # Keep the old function for backward compatibility
 def rotate_camera_center_y90(null_node):
@@ -244,7 +246,8 @@ def adjust_camera_to_fit_bbox(camera, bbox, padding_factor=1.1):
                 controlling_dimension = bbox_view_diagonal * 1.2
                 depth_for_clipping = bbox_diagonal / 2
                 
-                print(f"Camera has rotation ({null_r[0]}, {null_r[1]}, {null_r[2]}), using diagonal dimensions")
+                logger.debug("Camera has rotation (%s, %s, %s), using diagonal dimensions",
+                             null_r[0], null_r[1], null_r[2])
             else:
                 # Standard case - no significant rotation
                 controlling_dimension = max(bbox_width, bbox_height)
@@ -288,13 +291,12 @@ def adjust_camera_to_fit_bbox(camera, bbox, padding_factor=1.1):
                 ortho_width = controlling_dimension * padding_factor
                 camera.parm("orthowidth").set(ortho_width)
                 
-                print(f"Orthographic camera adjusted:")
-                print(f"  - Distance set to {required_distance} to prevent clipping")
-                print(f"  - Ortho width set to {ortho_width} to encompass bounding box")
+                logger.debug("Orthographic camera adjusted: distance %s, ortho width %s",
+                             required_distance, ortho_width)
             else:
-                print(f"Perspective camera distance adjusted to {required_distance} to encompass bounding box")
+                logger.debug("Perspective camera distance adjusted to %s", required_distance)
                 
-            print(f"Controlling dimension used: {controlling_dimension}")
+            logger.debug("Controlling dimension used: %s", controlling_dimension)
         else:
             # Fallback calculation if null not found
             max_dimension = max(bbox_width, bbox_height)
@@ -328,16 +330,13 @@ def adjust_camera_to_fit_bbox(camera, bbox, padding_factor=1.1):
                 # For orthographic, also set width
                 ortho_width = controlling_dimension * padding_factor
                 camera.parm("orthowidth").set(ortho_width)
-                print(f"Null node not found. Orthographic camera adjusted:")
-                print(f"  - Distance set to {required_distance} to prevent clipping")
-                print(f"  - Ortho width set to {ortho_width}")
+                logger.debug("Null node not found. Orthographic camera adjusted: distance %s, ortho width %s",
+                             required_distance, ortho_width)
             else:
-                print(f"Null node not found. Perspective camera distance set to {required_distance}")
+                logger.debug("Null node not found. Perspective camera distance set to %s", required_distance)
             
     except Exception as e:
-        print(f"Error adjusting camera: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Error adjusting camera: %s", e, exc_info=True)
 
 def setup_render_node(render_engine="opengl", karma_engine="cpu", render_path=None, camera_path="/obj/MCP_CAMERA", view_name=None, rotation=None, is_ortho=False):
     """
@@ -399,13 +398,13 @@ def setup_render_node(render_engine="opengl", karma_engine="cpu", render_path=No
         render_node = hou.node("/out").createNode(node_type, render_node_name)
         
         if not render_node:
-            print(f"Failed to create {render_engine} render node. Check if /out context exists.")
+            logger.warning("Failed to create %s render node. Check if /out context exists.", render_engine)
             return None, None
         
         # Check if the camera exists
         camera = hou.node(camera_path)
         if not camera:
-            print(f"Camera not found at {camera_path}")
+            logger.warning("Camera not found at %s", camera_path)
             return render_node, filepath
             
         # Get camera resolution
@@ -482,9 +481,7 @@ def setup_render_node(render_engine="opengl", karma_engine="cpu", render_path=No
         return render_node, filepath
         
     except Exception as e:
-        print(f"Error setting up render node: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Error setting up render node: %s", e, exc_info=True)
         return None, None
 
 # ======== RENDERING FUNCTIONS ========
@@ -507,25 +504,25 @@ def render_single_view(orthographic=False, rotation=(0, 90, 0), render_path=None
     displayed_geo = find_displayed_geometry()
     
     if not displayed_geo:
-        print("No displayed geometry found in the scene.")
+        logger.warning("No displayed geometry found in the scene.")
         return None
     
-    print(f"Found {len(displayed_geo)} displayed geometry nodes.")
+    logger.debug("Found %d displayed geometry nodes.", len(displayed_geo))
     
     # Calculate the bounding box
     bbox = calculate_bounding_box(displayed_geo)
     
     if not bbox:
-        print("Could not calculate bounding box.")
+        logger.warning("Could not calculate bounding box.")
         return None
     
-    print(f"Bounding box min: {bbox['min']}")
-    print(f"Bounding box max: {bbox['max']}")
-    print(f"Bounding box center: {bbox['center']}")
+    logger.debug("Bounding box min: %s", bbox['min'])
+    logger.debug("Bounding box max: %s", bbox['max'])
+    logger.debug("Bounding box center: %s", bbox['center'])
     
     # Set up the camera rig
     null = setup_camera_rig(bbox['center'], orthographic)
-    print(f"Created/updated camera rig at {bbox['center']}")
+    logger.debug("Created/updated camera rig at %s", bbox['center'])
     
     # Rotate the camera center by the specified angles
     rotate_camera_center(null, rotation)
@@ -536,7 +533,7 @@ def render_single_view(orthographic=False, rotation=(0, 90, 0), render_path=None
         # Adjust camera to fit bounding box
         adjust_camera_to_fit_bbox(camera, bbox)
     else:
-        print("Camera not found, couldn't adjust position.")
+        logger.warning("Camera not found, couldn't adjust position.")
         return None
     
     # Create render node and render a frame
@@ -550,15 +547,14 @@ def render_single_view(orthographic=False, rotation=(0, 90, 0), render_path=None
     )
     
     if not render_node:
-        print("Failed to create render node.")
+        logger.warning("Failed to create render node.")
         return None
     
     # Render the frame
-    print(f"Rendering with {render_engine.upper()}" + 
-          (f" ({karma_engine.upper()})" if render_engine.lower() == "karma" else ""))
+    logger.debug("Rendering with %s (karma engine: %s)", render_engine, karma_engine)
     render_node.render()
     
-    print(f"Rendered frame to: {filepath}")
+    logger.debug("Rendered frame to: %s", filepath)
     return filepath
 
 def render_quad_view(orthographic=True, render_path=None, render_engine="opengl", karma_engine="cpu"):
@@ -576,7 +572,7 @@ def render_quad_view(orthographic=True, render_path=None, render_engine="opengl"
         karma_engine: For Karma, which engine to use ("cpu" or "gpu")
     
     Returns:
-        A list of paths to the rendered files
+        A list of (filepath, view_name) tuples, one per rendered view
     """
     rendered_files = []
     
@@ -592,25 +588,25 @@ def render_quad_view(orthographic=True, render_path=None, render_engine="opengl"
     displayed_geo = find_displayed_geometry()
     
     if not displayed_geo:
-        print("No displayed geometry found in the scene.")
+        logger.warning("No displayed geometry found in the scene.")
         return rendered_files
     
-    print(f"Found {len(displayed_geo)} displayed geometry nodes.")
+    logger.debug("Found %d displayed geometry nodes.", len(displayed_geo))
     
     # Calculate the bounding box once
     bbox = calculate_bounding_box(displayed_geo)
     
     if not bbox:
-        print("Could not calculate bounding box.")
+        logger.warning("Could not calculate bounding box.")
         return rendered_files
     
-    print(f"Bounding box min: {bbox['min']}")
-    print(f"Bounding box max: {bbox['max']}")
-    print(f"Bounding box center: {bbox['center']}")
+    logger.debug("Bounding box min: %s", bbox['min'])
+    logger.debug("Bounding box max: %s", bbox['max'])
+    logger.debug("Bounding box center: %s", bbox['center'])
     
     # Render each view
     for view in views:
-        print(f"\n--- Setting up {view['name']} view ---")
+        logger.debug("Setting up %s view", view['name'])
         
         # Set up the camera rig
         null = setup_camera_rig(bbox['center'], view['ortho'])
@@ -624,7 +620,7 @@ def render_quad_view(orthographic=True, render_path=None, render_engine="opengl"
             # Adjust camera to fit bounding box
             adjust_camera_to_fit_bbox(camera, bbox)
         else:
-            print(f"Camera not found, couldn't adjust position for {view['name']} view.")
+            logger.warning("Camera not found, couldn't adjust position for %s view.", view['name'])
             continue
         
         # Create a specific name with the view
@@ -641,22 +637,20 @@ def render_quad_view(orthographic=True, render_path=None, render_engine="opengl"
         )
         
         if not render_node:
-            print(f"Failed to create render node for {view_name} view.")
+            logger.warning("Failed to create render node for %s view.", view_name)
             continue
         
         # Render the frame
-        print(f"Rendering {view_name} view with {render_engine.upper()}" + 
-              (f" ({karma_engine.upper()})" if render_engine.lower() == "karma" else ""))
+        logger.debug("Rendering %s view with %s (karma engine: %s)",
+                     view_name, render_engine, karma_engine)
         render_node.render()
         
-        print(f"Rendered {view_name} view to: {filepath}")
+        logger.debug("Rendered %s view to: %s", view_name, filepath)
         
         if filepath:
-            rendered_files.append(filepath)
+            rendered_files.append((filepath, view_name))
     
-    print(f"\nRendered {len(rendered_files)} views:")
-    for file in rendered_files:
-        print(f"  - {file}")
+    logger.debug("Rendered %d views: %s", len(rendered_files), rendered_files)
     
     return rendered_files
 
@@ -677,15 +671,15 @@ def render_specific_camera(camera_path, render_path=None, render_engine="opengl"
         # Check if the camera exists
         camera = hou.node(camera_path)
         if not camera:
-            print(f"Camera not found at path: {camera_path}")
+            logger.warning("Camera not found at path: %s", camera_path)
             return None
             
         # Check if it's actually a camera
         if camera.type().name() != "cam":
-            print(f"Node at {camera_path} is not a camera (type: {camera.type().name()})")
+            logger.warning("Node at %s is not a camera (type: %s)", camera_path, camera.type().name())
             return None
             
-        print(f"Found camera: {camera.path()}")
+        logger.debug("Found camera: %s", camera.path())
         
         # Determine if the camera is orthographic
         is_ortho = camera.parm("projection").eval() == 1
@@ -714,21 +708,18 @@ def render_specific_camera(camera_path, render_path=None, render_engine="opengl"
         )
         
         if not render_node:
-            print("Failed to create render node.")
+            logger.warning("Failed to create render node.")
             return None
         
         # Render the frame
-        print(f"Rendering with {render_engine.upper()}" + 
-              (f" ({karma_engine.upper()})" if render_engine.lower() == "karma" else ""))
+        logger.debug("Rendering with %s (karma engine: %s)", render_engine, karma_engine)
         render_node.render()
         
-        print(f"Rendered frame using camera {camera_path} to: {filepath}")
+        logger.debug("Rendered frame using camera %s to: %s", camera_path, filepath)
         return filepath
         
     except Exception as e:
-        print(f"Error rendering specific camera: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Error rendering specific camera: %s", e, exc_info=True)
         return None
 
 # ======== EXAMPLE USAGE ========
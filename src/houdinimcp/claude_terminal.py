@@ -12,19 +12,10 @@ Requires: PySide2 (bundled with Houdini), optionally pyte for ANSI parsing.
 """
 import atexit
 import os
-import re
 
 from PySide2 import QtWidgets, QtCore, QtGui
 
-
-# ANSI escape stripping — use pyte if available, otherwise regex fallback
-try:
-    import pyte
-    _PYTE_AVAILABLE = True
-except ImportError:
-    _PYTE_AVAILABLE = False
-
-_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\][^\x07]*\x07')
+from .claude_terminal_text import strip_ansi
 
 THEMES = {
     "dark": {"bg": "#1e1e1e", "fg": "#d4d4d4"},
@@ -37,16 +28,6 @@ MAX_FONT_SIZE = 24
 DEFAULT_SCROLLBACK = 10000
 
 
-def strip_ansi(text):
-    """Remove ANSI escape sequences from text."""
-    if _PYTE_AVAILABLE:
-        screen = pyte.Screen(200, 50)
-        stream = pyte.Stream(screen)
-        stream.feed(text)
-        return "\n".join(screen.display).rstrip()
-    return _ANSI_RE.sub('', text)
-
-
 class ConnectionStatusLED(QtWidgets.QWidget):
     """Small coloured circle indicating MCP connection status."""
 
@@ -0,0 +1,27 @@
+"""ANSI escape stripping for the Claude terminal panel.
+
+Kept free of PySide2 so it can be imported (and tested) outside Houdini.
+"""
+import re
+
+# Use pyte if available, otherwise regex fallback
+try:
+    import pyte
+    _PYTE_AVAILABLE = True
+except ImportError:
+    _PYTE_AVAILABLE = False
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\][^\x07]*\x07')
+
+
+def strip_ansi(text):
+    """Remove ANSI escape sequences from text."""
+    if _PYTE_AVAILABLE:
+        screen = pyte.Screen(200, 50)
+        stream = pyte.Stream(screen)
+        stream.feed(text)
+        return "\n".join(screen.display).rstrip()
+    # Every sequence starts with ESC; most output lines have none
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
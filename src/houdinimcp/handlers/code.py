@@ -1,8 +1,10 @@
 """Code execution handler with dangerous pattern guard."""
 import io
+import re
 import sys
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
 
 import hou
 
@@ -10,23 +12,31 @@ DANGEROUS_PATTERNS = [
     "hou.exit", "os.remove", "os.unlink", "shutil.rmtree",
     "subprocess", "os.system", "os.popen", "__import__",
 ]
+# One scan over the code instead of one substring search per pattern
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)))
+
+
+@lru_cache(maxsize=128)
+def _compile_code(code):
+    """Compile a snippet once; clients often resend the same code with new data."""
+    return compile(code, "<mcp>", "exec")
 
 
 def execute_code(code, allow_dangerous=False):
     """Executes arbitrary Python code within Houdini."""
     if not allow_dangerous:
-        for pattern in DANGEROUS_PATTERNS:
-            if pattern in code:
-                raise ValueError(
-                    f"Dangerous pattern detected: '{pattern}'. "
-                    "Pass allow_dangerous=True to override."
-                )
+        match = _DANGEROUS_RE.search(code)
+        if match:
+            raise ValueError(
+                f"Dangerous pattern detected: '{match.group()}'. "
+                "Pass allow_dangerous=True to override."
+            )
     stdout_capture = io.StringIO()
     stderr_capture = io.StringIO()
     try:
         namespace = {"hou": hou}
         with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            exec(code, namespace)
+            exec(_compile_code(code), namespace)
 
         return {
             "executed": True,
@@ -1,8 +1,20 @@
 """Node CRUD, wiring, flags, layout, and material handlers."""
-import traceback
+import logging
+from itertools import islice
 
 import hou
 
+logger = logging.getLogger(__name__)
+
+
+def _apply_parms(node, parameters):
+    """Set parameters on a node, skipping writes that would not change the value."""
+    for p_name, p_val in parameters.items():
+        parm = node.parm(p_name)
+        # parm.set() dirties the node even when the value is unchanged
+        if parm and parm.eval() != p_val:
+            parm.set(p_val)
+
 
 def create_node(node_type, parent_path="/obj", name=None, position=None, parameters=None):
     """Creates a new node in the specified parent."""
@@ -12,13 +24,10 @@ def create_node(node_type, parent_path="/obj", name=None, position=None, paramet
             raise ValueError(f"Parent path not found: {parent_path}")
 
         node = parent.createNode(node_type, node_name=name)
-        if position and len(position) >= 2:
+        if position and len(position) >= 2 and list(node.position()) != list(position[:2]):
             node.setPosition([position[0], position[1]])
         if parameters:
-            for p_name, p_val in parameters.items():
-                parm = node.parm(p_name)
-                if parm:
-                    parm.set(p_val)
+            _apply_parms(node, parameters)
 
         return {
             "name": node.name(),
@@ -48,12 +57,18 @@ def modify_node(path, parameters=None, position=None, name=None):
         changes.append(f"Position set to {position}")
 
     if parameters:
-        for p_name, p_val in parameters.items():
+        old_vals = {}
+        for p_name in parameters:
             parm = node.parm(p_name)
             if parm:
-                old_val = parm.eval()
-                parm.set(p_val)
-                changes.append(f"Parameter {p_name} changed from {old_val} to {p_val}")
+                old_vals[p_name] = parm.eval()
+        updates = {k: parameters[k] for k, old in old_vals.items() if old != parameters[k]}
+        if updates:
+            # One setParms() call instead of a HOM round trip per parameter
+            node.setParms(updates)
+        changes.extend(
+            f"Parameter {k} changed from {old_vals[k]} to {v}" for k, v in updates.items()
+        )
 
     return {"path": node.path(), "changes": changes}
 
@@ -69,30 +84,61 @@ def delete_node(path):
     return {"deleted": node_path, "name": node_name}
 
 
-def get_node_info(path):
-    """Returns detailed information about a single node."""
+def delete_nodes(paths):
+    """Deletes several nodes, issuing one deleteItems() call per parent."""
+    # Resolve everything before deleting anything; duplicates collapse by path
+    nodes_by_path = {}
+    for path in paths:
+        node = hou.node(path)
+        if not node:
+            raise ValueError(f"Node not found: {path}")
+        nodes_by_path[node.path()] = node
+
+    by_parent = {}
+    for node_path, node in nodes_by_path.items():
+        # A node inside another listed node goes away with its ancestor
+        parts = node_path.split("/")
+        if any("/".join(parts[:i]) in nodes_by_path for i in range(2, len(parts))):
+            continue
+        parent = node.parent()
+        by_parent.setdefault(parent.path(), (parent, []))[1].append(node)
+
+    deleted = []
+    for parent, nodes in by_parent.values():
+        node_paths = [n.path() for n in nodes]
+        parent.deleteItems(nodes)
+        deleted.extend(node_paths)
+    return {"deleted": deleted, "count": len(deleted)}
+
+
+def get_node_info(path, max_parms=20):
+    """Returns detailed information about a single node (first max_parms parameters)."""
     node = hou.node(path)
     if not node:
         raise ValueError(f"Node not found: {path}")
 
+    node_type = node.type()
+    position = node.position()
+    color = node.color()
+    # Not every node category has display/render flags (e.g. VOPs)
+    display_flag = getattr(node, "isDisplayFlagSet", None)
+    render_flag = getattr(node, "isRenderFlagSet", None)
     node_info = {
         "name": node.name(),
         "path": node.path(),
-        "type": node.type().name(),
-        "category": node.type().category().name(),
-        "position": [node.position()[0], node.position()[1]],
-        "color": list(node.color()) if node.color() else None,
+        "type": node_type.name(),
+        "category": node_type.category().name(),
+        "position": [position[0], position[1]],
+        "color": list(color) if color else None,
         "is_bypassed": node.isBypassed(),
-        "is_displayed": getattr(node, "isDisplayFlagSet", lambda: None)(),
-        "is_rendered": getattr(node, "isRenderFlagSet", lambda: None)(),
+        "is_displayed": display_flag() if display_flag else None,
+        "is_rendered": render_flag() if render_flag else None,
         "parameters": [],
         "inputs": [],
         "outputs": []
     }
 
-    for i, parm in enumerate(node.parms()):
-        if i >= 20:
-            break
+    for parm in islice(node.parms(), max_parms):
         node_info["parameters"].append({
             "name": parm.name(),
             "label": parm.label(),
@@ -156,13 +202,14 @@ def set_node_flags(node_path, display=None, render=None, bypass=None):
     if not node:
         raise ValueError(f"Node not found: {node_path}")
     changes = []
-    if display is not None:
+    # Flag writes invalidate downstream cooks even when the value is unchanged
+    if display is not None and node.isDisplayFlagSet() != display:
         node.setDisplayFlag(display)
         changes.append(f"display={display}")
-    if render is not None:
+    if render is not None and node.isRenderFlagSet() != render:
         node.setRenderFlag(render)
         changes.append(f"render={render}")
-    if bypass is not None:
+    if bypass is not None and node.isBypassed() != bypass:
         node.bypass(bypass)
         changes.append(f"bypass={bypass}")
     return {"path": node.path(), "changes": changes}
@@ -188,6 +235,34 @@ def set_node_color(node_path, color):
     return {"path": node.path(), "color": color}
 
 
+def _assign_via_material_sop(target_node, mat_path):
+    """Assign a material through a Material SOP inside the OBJ's geometry network."""
+    geo_sop = target_node.node("geometry")
+    if not geo_sop:
+        raise RuntimeError("No 'geometry' node found inside OBJ to apply material to.")
+
+    material_sop = geo_sop.node("material1")
+    if not material_sop:
+        material_sop = geo_sop.createNode("material", "material1")
+        first_sop = None
+        for c in geo_sop.children():
+            if c.isDisplayFlagSet():
+                first_sop = c
+                break
+        if first_sop:
+            material_sop.setFirstInput(first_sop)
+        material_sop.setDisplayFlag(True)
+        material_sop.setRenderFlag(True)
+
+    mat_sop_parm = material_sop.parm("shop_materialpath1")
+    if mat_sop_parm:
+        mat_sop_parm.set(mat_path)
+    else:
+        raise RuntimeError(
+            "No shop_materialpath1 on Material SOP to assign the material."
+        )
+
+
 def set_material(node_path, material_type="principledshader", name=None, parameters=None):
     """Creates or applies a material to an OBJ node."""
     try:
@@ -212,48 +287,25 @@ def set_material(node_path, material_type="principledshader", name=None, paramet
             mat_node = mat_context.createNode(material_type, mat_name)
 
         if parameters:
-            for k, v in parameters.items():
-                p = mat_node.parm(k)
-                if p:
-                    p.set(v)
+            _apply_parms(mat_node, parameters)
 
+        mat_path = mat_node.path()
         mat_parm = target_node.parm("shop_materialpath")
         if mat_parm:
-            mat_parm.set(mat_node.path())
+            # Common case: OBJ-level assignment, no SOP network changes needed
+            if mat_parm.eval() != mat_path:
+                mat_parm.set(mat_path)
         else:
-            geo_sop = target_node.node("geometry")
-            if not geo_sop:
-                raise RuntimeError("No 'geometry' node found inside OBJ to apply material to.")
-
-            material_sop = geo_sop.node("material1")
-            if not material_sop:
-                material_sop = geo_sop.createNode("material", "material1")
-                first_sop = None
-                for c in geo_sop.children():
-                    if c.isDisplayFlagSet():
-                        first_sop = c
-                        break
-                if first_sop:
-                    material_sop.setFirstInput(first_sop)
-                material_sop.setDisplayFlag(True)
-                material_sop.setRenderFlag(True)
-
-            mat_sop_parm = material_sop.parm("shop_materialpath1")
-            if mat_sop_parm:
-                mat_sop_parm.set(mat_node.path())
-            else:
-                raise RuntimeError(
-                    "No shop_materialpath1 on Material SOP to assign the material."
-                )
+            _assign_via_material_sop(target_node, mat_path)
 
         return {
             "status": "ok",
-            "material_node": mat_node.path(),
+            "material_node": mat_path,
             "applied_to": target_node.path(),
         }
 
     except Exception as e:
-        traceback.print_exc()
+        logger.debug("set_material failed for %s", node_path, exc_info=True)
         return {"status": "error", "message": str(e), "node": node_path}
 
 
@@ -275,23 +327,34 @@ def set_expression(node_path, parm_name, expression, language="hscript"):
     }
 
 
-def find_error_nodes(root_path="/obj"):
-    """Scan node hierarchy for cook errors and warnings."""
+def find_error_nodes(root_path="/obj", max_results=100):
+    """Scan node hierarchy for cook errors and warnings, stopping after max_results hits."""
     root = hou.node(root_path)
     if not root:
         raise ValueError(f"Root node not found: {root_path}")
     error_nodes = []
+    truncated = False
     for node in root.allSubChildren():
-        if node.errors():
-            error_nodes.append({
-                "path": node.path(),
-                "type": node.type().name(),
-                "errors": node.errors(),
-            })
-        elif node.warnings():
-            error_nodes.append({
-                "path": node.path(),
-                "type": node.type().name(),
-                "warnings": node.warnings(),
-            })
-    return {"root": root_path, "error_count": len(error_nodes), "nodes": error_nodes}
+        # Only ask for warnings when there are no errors; each call crosses into C++
+        errors = node.errors()
+        if errors:
+            key, messages = "errors", errors
+        else:
+            warnings = node.warnings()
+            if not warnings:
+                continue
+            key, messages = "warnings", warnings
+        if len(error_nodes) >= max_results:
+            truncated = True
+            break
+        error_nodes.append({
+            "path": node.path(),
+            "type": node.type().name(),
+            key: messages,
+        })
+    return {
+        "root": root_path,
+        "error_count": len(error_nodes),
+        "truncated": truncated,
+        "nodes": error_nodes,
+    }
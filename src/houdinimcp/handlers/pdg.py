@@ -44,17 +44,17 @@ def pdg_workitems(path, state=None):
     if not pdg_node:
         raise ValueError(f"No PDG node for: {path}")
     items = []
+    state_filter = state.lower() if state else None
     for wi in pdg_node.workItems:
         wi_state = str(wi.state)
-        if state and state.lower() not in wi_state.lower():
+        if state_filter and state_filter not in wi_state.lower():
             continue
-        item = {
+        items.append({
             "id": wi.id,
             "index": wi.index,
             "state": wi_state,
             "output_files": [f.path for f in wi.outputFiles],
-        }
-        items.append(item)
+        })
     return {"path": node.path(), "count": len(items), "work_items": items}
 
 
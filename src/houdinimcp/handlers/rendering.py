@@ -1,35 +1,65 @@
 """Rendering handlers (OpenGL, Karma, Mantra, flipbook)."""
+import logging
+import mmap
 import os
 import tempfile
-import traceback
-import base64
 
 import hou
 from ..HoudiniMCPRender import render_single_view, render_quad_view, render_specific_camera
 
+# SIMD base64 for multi-megabyte render payloads; optional like orjson in server.py
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
-def _process_rendered_image(filepath, camera_path=None, view_name=None):
-    """Read, base64-encode, and return metadata for a rendered image file."""
-    if not filepath or not os.path.exists(filepath):
-        return {"status": "error", "message": f"Rendered file not found: {filepath}",
+logger = logging.getLogger(__name__)
+
+
+def _camera_resolution(camera_path):
+    """Return [resx, resy] for a camera node, or [0, 0] when it has none."""
+    cam_node = hou.node(camera_path) if camera_path else None
+    if not cam_node:
+        return [0, 0]
+    resx, resy = cam_node.parm("resx"), cam_node.parm("resy")
+    if not (resx and resy):
+        return [0, 0]
+    return [resx.eval(), resy.eval()]
+
+
+def _process_rendered_image(filepath, resolution=None, view_name=None, return_image=True):
+    """Read, base64-encode, and return metadata for a rendered image file.
+
+    With return_image=False the file is left on disk and only its path is
+    returned, for clients that share a filesystem with Houdini.
+    """
+    not_found = {"status": "error", "message": f"Rendered file not found: {filepath}",
+                 "origin": "_process_rendered_image"}
+    if not filepath:
+        return not_found
+    try:
+        size = os.path.getsize(filepath)
+    except FileNotFoundError:
+        return not_found
+    # A render that wrote nothing is a failure (and mmap cannot map a zero-length file)
+    if size == 0:
+        return {"status": "error", "message": f"Rendered file is empty: {filepath}",
                 "origin": "_process_rendered_image"}
 
+    encoded_string = None
+    if return_image:
+        # Encode straight from the page cache rather than a read() copy of the file
+        with open(filepath, "rb") as image_file, \
+                mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+            encoded_string = b64encode(image_map).decode('ascii')
+
     _, ext = os.path.splitext(filepath)
     fmt = ext[1:].lower() if ext else 'unknown'
 
-    resolution = [0, 0]
-    if camera_path:
-        cam_node = hou.node(camera_path)
-        if cam_node and cam_node.parm("resx") and cam_node.parm("resy"):
-            resolution = [cam_node.parm("resx").eval(), cam_node.parm("resy").eval()]
-
-    with open(filepath, "rb") as image_file:
-        encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-
     result_data = {
         "status": "success",
         "format": fmt,
-        "resolution": resolution,
+        "resolution": resolution or [0, 0],
         "image_base64": encoded_string,
         "filepath_on_server": filepath,
     }
@@ -38,9 +68,16 @@ def _process_rendered_image(filepath, camera_path=None, view_name=None):
     return result_data
 
 
+def _render_error(origin, summary, exc):
+    """Build the error response shared by the handle_render_* commands."""
+    # logger.debug checks the level before formatting, so the traceback costs nothing unless enabled
+    logger.debug("%s failed", origin, exc_info=True)
+    return {"status": "error", "message": f"{summary}: {exc}", "origin": origin}
+
+
 def handle_render_single_view(orthographic=False, rotation=(0, 90, 0),
                                render_path=None, render_engine="opengl",
-                               karma_engine="cpu"):
+                               karma_engine="cpu", return_image=True):
     """Handles the 'render_single_view' command."""
     if not render_path:
         render_path = tempfile.gettempdir()
@@ -54,46 +91,39 @@ def handle_render_single_view(orthographic=False, rotation=(0, 90, 0),
             render_engine=render_engine,
             karma_engine=karma_engine
         )
-        return _process_rendered_image(filepath, "/obj/MCP_CAMERA")
+        return _process_rendered_image(filepath, _camera_resolution("/obj/MCP_CAMERA"),
+                                       return_image=return_image)
     except Exception as e:
-        traceback.print_exc()
-        return {"status": "error", "message": f"Render Single View Failed: {str(e)}",
-                "origin": "handle_render_single_view"}
+        return _render_error("handle_render_single_view", "Render Single View Failed", e)
 
 
 def handle_render_quad_view(orthographic=True, render_path=None,
-                             render_engine="opengl", karma_engine="cpu"):
+                             render_engine="opengl", karma_engine="cpu",
+                             return_image=True):
     """Handles the 'render_quad_view' command."""
     if not render_path:
         render_path = tempfile.gettempdir()
     try:
-        filepaths = render_quad_view(
+        renders = render_quad_view(
             orthographic=orthographic,
             render_path=render_path,
             render_engine=render_engine,
             karma_engine=karma_engine
         )
-        results = []
-        camera_path = "/obj/MCP_CAMERA"
-        for fp in filepaths:
-            view_name = None
-            try:
-                filename = os.path.basename(fp)
-                parts = filename.split('_')
-                if len(parts) > 2:
-                    view_name = parts[2]
-            except Exception:
-                pass
-            results.append(_process_rendered_image(fp, camera_path, view_name))
+        # All four views share MCP_CAMERA, so its resolution is read once
+        resolution = _camera_resolution("/obj/MCP_CAMERA")
+        results = [
+            _process_rendered_image(fp, resolution, view_name, return_image)
+            for fp, view_name in renders
+        ]
         return {"status": "success", "results": results}
     except Exception as e:
-        traceback.print_exc()
-        return {"status": "error", "message": f"Render Quad View Failed: {str(e)}",
-                "origin": "handle_render_quad_view"}
+        return _render_error("handle_render_quad_view", "Render Quad View Failed", e)
 
 
 def handle_render_specific_camera(camera_path, render_path=None,
-                                   render_engine="opengl", karma_engine="cpu"):
+                                   render_engine="opengl", karma_engine="cpu",
+                                   return_image=True):
     """Handles the 'render_specific_camera' command."""
     if not render_path:
         render_path = tempfile.gettempdir()
@@ -108,11 +138,10 @@ def handle_render_specific_camera(camera_path, render_path=None,
             render_engine=render_engine,
             karma_engine=karma_engine
         )
-        return _process_rendered_image(filepath, camera_path)
+        return _process_rendered_image(filepath, _camera_resolution(camera_path),
+                                       return_image=return_image)
     except Exception as e:
-        traceback.print_exc()
-        return {"status": "error", "message": f"Render Specific Camera Failed: {str(e)}",
-                "origin": "handle_render_specific_camera"}
+        return _render_error("handle_render_specific_camera", "Render Specific Camera Failed", e)
 
 
 def render_flipbook(frame_range=None, output=None, resolution=None):
@@ -1,9 +1,28 @@
 """Scene management handlers."""
+import logging
 import os
-import traceback
+import time
+from itertools import islice
 
 import hou
 
+logger = logging.getLogger(__name__)
+
+SCENE_INFO_TTL = 0.5  # seconds — clients poll get_scene_info to refresh UI
+MAX_TOP_NODES = 10
+_scene_info_cache = None  # (monotonic timestamp, include_node_count, scene_info)
+
+
+def invalidate_scene_info():
+    """Drop the cached get_scene_info result (called after mutating commands)."""
+    global _scene_info_cache
+    _scene_info_cache = None
+
+
+def _copy_scene_info(info):
+    """Copy a cached result so a caller editing it (or its node list) cannot corrupt the cache."""
+    return {**info, "nodes": list(info["nodes"])}
+
 
 def get_asset_lib_status():
     """Checks if the user toggled asset library usage in hou.session."""
@@ -14,45 +33,54 @@ def get_asset_lib_status():
     return {"enabled": use_assetlib, "message": msg}
 
 
-def get_scene_info():
-    """Returns basic info about the current .hip file and a few top-level nodes."""
+def get_scene_info(include_node_count=False):
+    """Returns basic info about the current .hip file and a few top-level nodes.
+
+    node_count requires walking the whole node tree, so it is only computed
+    when include_node_count is True; otherwise it is None.
+    """
+    global _scene_info_cache
+    now = time.monotonic()
+    if (_scene_info_cache and now - _scene_info_cache[0] < SCENE_INFO_TTL
+            and _scene_info_cache[1] == include_node_count):
+        return _copy_scene_info(_scene_info_cache[2])
     try:
         hip_file = hou.hipFile.name()
+        root = hou.node("/")
+        start_frame, end_frame = hou.playbar.frameRange()
         scene_info = {
             "name": os.path.basename(hip_file) if hip_file else "Untitled",
             "filepath": hip_file or "",
-            "node_count": len(hou.node("/").allSubChildren()),
+            "node_count": len(root.allSubChildren()) if include_node_count else None,
             "nodes": [],
             "fps": hou.fps(),
-            "start_frame": hou.playbar.frameRange()[0],
-            "end_frame": hou.playbar.frameRange()[1],
+            "start_frame": start_frame,
+            "end_frame": end_frame,
         }
 
-        root = hou.node("/")
         contexts = ["obj", "shop", "out", "ch", "vex", "stage"]
         top_nodes = []
 
         for ctx_name in contexts:
             ctx_node = root.node(ctx_name)
-            if ctx_node:
-                children = ctx_node.children()
-                for node in children:
-                    if len(top_nodes) >= 10:
-                        break
-                    top_nodes.append({
-                        "name": node.name(),
-                        "path": node.path(),
-                        "type": node.type().name(),
-                        "category": ctx_name,
-                    })
-                if len(top_nodes) >= 10:
-                    break
+            if not ctx_node:
+                continue
+            for node in islice(ctx_node.children(), MAX_TOP_NODES - len(top_nodes)):
+                top_nodes.append({
+                    "name": node.name(),
+                    "path": node.path(),
+                    "type": node.type().name(),
+                    "category": ctx_name,
+                })
+            if len(top_nodes) >= MAX_TOP_NODES:
+                break
 
         scene_info["nodes"] = top_nodes
-        return scene_info
+        _scene_info_cache = (now, include_node_count, scene_info)
+        return _copy_scene_info(scene_info)
 
     except Exception as e:
-        traceback.print_exc()
+        logger.debug("get_scene_info failed", exc_info=True)
         return {"error": str(e)}
 
 
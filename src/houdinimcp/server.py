@@ -1,16 +1,18 @@
 """Houdini-side TCP server that receives JSON commands from the MCP bridge."""
 import hou
 import json
+import logging
 import socket
-import traceback
 import os
+from contextlib import contextmanager
 from PySide2 import QtCore
 
 from .handlers.scene import (
     get_scene_info, save_scene, load_scene, set_frame, get_asset_lib_status,
+    invalidate_scene_info,
 )
 from .handlers.nodes import (
-    create_node, modify_node, delete_node, get_node_info, set_material,
+    create_node, modify_node, delete_node, delete_nodes, get_node_info, set_material,
     connect_nodes, disconnect_node_input, set_node_flags,
     layout_children, set_node_color, set_expression, find_error_nodes,
 )
@@ -27,26 +29,119 @@ from .handlers.rendering import (
 )
 from .event_collector import EventCollector
 
+# Optional speedups (orjson here, pybase64 in handlers/rendering.py) are not bundled
+# with Houdini's Python; use them when the user has installed them, else the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 EXTENSION_NAME = "Houdini MCP"
 EXTENSION_VERSION = (0, 2)
 EXTENSION_DESCRIPTION = "Connect Houdini to Claude via MCP"
 
 DEFAULT_PORT = int(os.environ.get("HOUDINIMCP_PORT", 9876))
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 4  # each message is a big-endian uint32 length followed by a JSON payload
+RECV_SIZE = 65536
+SEND_TIMEOUT = 10.0  # seconds; matches the bridge's receive timeout
+
+
+def _encode_json(obj):
+    """Serialize a response to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact separators: render responses carry megabytes of base64 plus nested metadata
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_json(data):
+    """Parse a UTF-8 JSON payload (bytes or bytearray)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def suppress_updates():
+    """Hold viewport/network updates in manual mode so a run of edits refreshes once."""
+    previous = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+    try:
+        yield
+    finally:
+        hou.setUpdateMode(previous)
 
 
 class HoudiniMCPServer:
-    MUTATING_COMMANDS = {
-        "create_node", "modify_node", "delete_node", "execute_code",
+    MUTATING_COMMANDS = frozenset({
+        "create_node", "modify_node", "delete_node", "delete_nodes", "execute_code",
         "set_material", "connect_nodes", "disconnect_node_input",
         "set_node_flags", "save_scene", "load_scene", "set_expression",
         "set_frame", "layout_children", "set_node_color",
         "pdg_cook", "pdg_dirty", "pdg_cancel",
         "lop_import", "hda_install", "hda_create", "batch",
+    })
+    # Undo-group labels built once rather than formatted per command
+    _UNDO_LABELS = {cmd: f"MCP: {cmd}" for cmd in MUTATING_COMMANDS}
+    # Renders add camera/ROP nodes without being undoable edits; they still stale get_scene_info
+    _SCENE_CHANGING_COMMANDS = MUTATING_COMMANDS | {
+        "render_single_view", "render_quad_view", "render_specific_camera",
     }
 
     # Re-export for tests that reference it on the class
     DANGEROUS_PATTERNS = DANGEROUS_PATTERNS
 
+    # Handlers that don't need self; bound-method handlers are added in _get_handlers()
+    _MODULE_HANDLERS = {
+        "get_scene_info": get_scene_info,
+        "create_node": create_node,
+        "modify_node": modify_node,
+        "delete_node": delete_node,
+        "delete_nodes": delete_nodes,
+        "get_node_info": get_node_info,
+        "execute_code": execute_code,
+        "set_material": set_material,
+        "get_asset_lib_status": get_asset_lib_status,
+        "connect_nodes": connect_nodes,
+        "disconnect_node_input": disconnect_node_input,
+        "set_node_flags": set_node_flags,
+        "save_scene": save_scene,
+        "load_scene": load_scene,
+        "set_expression": set_expression,
+        "set_frame": set_frame,
+        "get_geo_summary": get_geo_summary,
+        "geo_export": geo_export,
+        "layout_children": layout_children,
+        "set_node_color": set_node_color,
+        "find_error_nodes": find_error_nodes,
+        "pdg_cook": pdg_cook,
+        "pdg_status": pdg_status,
+        "pdg_workitems": pdg_workitems,
+        "pdg_dirty": pdg_dirty,
+        "pdg_cancel": pdg_cancel,
+        "lop_stage_info": lop_stage_info,
+        "lop_prim_get": lop_prim_get,
+        "lop_prim_search": lop_prim_search,
+        "lop_layer_info": lop_layer_info,
+        "lop_import": lop_import,
+        "hda_list": hda_list,
+        "hda_get": hda_get,
+        "hda_install": hda_install,
+        "hda_create": hda_create,
+        "render_single_view": handle_render_single_view,
+        "render_quad_view": handle_render_quad_view,
+        "render_specific_camera": handle_render_specific_camera,
+        "render_flipbook": render_flipbook,
+    }
+
+    # Declared lengths above this drop the client rather than buffering toward it
+    MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+    _handlers = None
+    _handlers_use_assetlib = False
+
     def __init__(self, host='localhost', port=None):
         port = port if port is not None else DEFAULT_PORT
         self.host = host
@@ -54,22 +149,31 @@ class HoudiniMCPServer:
         self.running = False
         self.socket = None
         self.client = None
-        self.buffer = b''
-        self.timer = None
+        self.buffer = bytearray()
+        # Reused for every recv_into() so draining the socket allocates no per-read bytes
+        self._recv_view = memoryview(bytearray(RECV_SIZE))
+        self.accept_notifier = None
+        self.read_notifier = None
         self.event_collector = EventCollector()
+        # A ping arriving over the socket always has a client, so its reply never changes
+        ping_payload = _encode_json({"status": "success", "result": {
+            "alive": True, "host": host, "port": port, "has_client": True,
+        }})
+        self._ping_frame = len(ping_payload).to_bytes(HEADER_SIZE, "big") + ping_payload
 
     def start(self):
-        """Begin listening on the given port; sets up a QTimer to poll for data."""
+        """Begin listening on the given port; Qt socket notifiers wake us when data arrives."""
         self.running = True
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
+            # Let a reconnecting bridge queue up instead of being refused while the old client drains
+            self.socket.listen(16)
             self.socket.setblocking(False)
-            self.timer = QtCore.QTimer()
-            self.timer.timeout.connect(self._process_server)
-            self.timer.start(100)
+            self.accept_notifier = QtCore.QSocketNotifier(
+                self.socket.fileno(), QtCore.QSocketNotifier.Read)
+            self.accept_notifier.activated.connect(self._on_accept)
             self.event_collector.start()
             print(f"HoudiniMCP server started on {self.host}:{self.port}")
         except Exception as e:
@@ -77,60 +181,126 @@ class HoudiniMCPServer:
             self.stop()
 
     def stop(self):
-        """Stop listening; close sockets and timers."""
+        """Stop listening; close sockets and notifiers."""
         self.running = False
         self.event_collector.stop()
-        if self.timer:
-            self.timer.stop()
-            self.timer = None
+        if self.accept_notifier:
+            self.accept_notifier.setEnabled(False)
+            self.accept_notifier.deleteLater()
+            self.accept_notifier = None
+        if self.client:
+            self._drop_client()
         if self.socket:
             self.socket.close()
-        if self.client:
-            self.client.close()
         self.socket = None
-        self.client = None
         print("HoudiniMCP server stopped")
 
-    def _process_server(self):
-        """Timer callback to accept connections and process incoming data."""
+    def _on_accept(self):
+        """Accept notifier callback: take the pending connection."""
         if not self.running:
             return
         try:
-            if not self.client and self.socket:
-                try:
-                    self.client, address = self.socket.accept()
-                    self.client.setblocking(False)
-                    print(f"Connected to client: {address}")
-                except BlockingIOError:
-                    pass
-                except Exception as e:
-                    print(f"Error accepting connection: {str(e)}")
-            if self.client:
+            self.client, address = self.socket.accept()
+        except BlockingIOError:
+            return
+        except Exception as e:
+            print(f"Error accepting connection: {str(e)}")
+            return
+        self.client.setblocking(False)
+        # Small request/response pairs: don't let Nagle hold replies back
+        self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        # Notice a bridge that vanished without a FIN (killed, sleeping laptop) and free the slot
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # One client at a time; the listen notifier would otherwise fire on every pending connect
+        self.accept_notifier.setEnabled(False)
+        self.read_notifier = QtCore.QSocketNotifier(
+            self.client.fileno(), QtCore.QSocketNotifier.Read)
+        self.read_notifier.activated.connect(self._on_client_readable)
+        print(f"Connected to client: {address}")
+
+    def _on_client_readable(self):
+        """Read notifier callback: drain the socket, then process complete messages."""
+        if not self.running or not self.client:
+            return
+        try:
+            while True:
                 try:
-                    data = self.client.recv(8192)
-                    if data:
-                        self.buffer += data
-                        try:
-                            command = json.loads(self.buffer.decode('utf-8'))
-                            self.buffer = b''
-                            response = self.execute_command(command)
-                            self.client.sendall(json.dumps(response).encode('utf-8'))
-                        except json.JSONDecodeError:
-                            pass
-                    else:
-                        print("Client disconnected")
-                        self.client.close()
-                        self.client = None
-                        self.buffer = b''
+                    n = self.client.recv_into(self._recv_view)
                 except BlockingIOError:
-                    pass
-                except Exception as e:
-                    print(f"Error receiving data: {str(e)}")
-                    self.client.close()
-                    self.client = None
-                    self.buffer = b''
+                    break
+                if not n:
+                    print("Client disconnected")
+                    self._drop_client()
+                    return
+                self.buffer.extend(self._recv_view[:n])
+                if len(self.buffer) > self.MAX_MESSAGE_BYTES:
+                    break  # let _process_messages inspect the header before reading more
+            self._process_messages()
         except Exception as e:
-            print(f"Server error: {str(e)}")
+            print(f"Error receiving data: {str(e)}")
+            self._drop_client()
+
+    def _drop_client(self):
+        """Close the client connection and start accepting a new one."""
+        if self.read_notifier:
+            # Usually called from this notifier's own activated slot; destroying it
+            # mid-emit is unsafe, so let Qt delete it once control returns to the loop
+            self.read_notifier.setEnabled(False)
+            self.read_notifier.deleteLater()
+            self.read_notifier = None
+        self.client.close()
+        self.client = None
+        self.buffer.clear()
+        if self.accept_notifier:
+            self.accept_notifier.setEnabled(True)
+
+    def _process_messages(self):
+        """Execute every complete length-prefixed message in the buffer."""
+        while len(self.buffer) >= HEADER_SIZE:
+            length = int.from_bytes(self.buffer[:HEADER_SIZE], "big")
+            if length > self.MAX_MESSAGE_BYTES:
+                logger.error("Message of %d bytes exceeds limit of %d; dropping client",
+                             length, self.MAX_MESSAGE_BYTES)
+                self._drop_client()
+                return
+            end = HEADER_SIZE + length
+            if len(self.buffer) < end:
+                return
+            command = _decode_json(self.buffer[HEADER_SIZE:end])
+            del self.buffer[:end]
+            # Non-object payloads fall through so execute_command reports the error
+            if isinstance(command, dict) and command.get("type") == "ping":
+                self._sendall_blocking(self._ping_frame)
+                continue
+            response = self.execute_command(command)
+            self._send_frame(_encode_json(response))
+
+    def _send_frame(self, payload):
+        """Send a length header and payload without concatenating them."""
+        header = len(payload).to_bytes(HEADER_SIZE, "big")
+        if not hasattr(self.client, "sendmsg"):  # Windows
+            self._sendall_blocking(header, payload)
+            return
+        try:
+            sent = self.client.sendmsg([header, payload])
+        except BlockingIOError:
+            sent = 0
+        if sent < HEADER_SIZE:
+            self._sendall_blocking(header[sent:], payload)
+        elif sent < HEADER_SIZE + len(payload):
+            self._sendall_blocking(memoryview(payload)[sent - HEADER_SIZE:])
+
+    def _sendall_blocking(self, *chunks):
+        """Write chunks in full, waiting up to SEND_TIMEOUT for the bridge to drain the socket."""
+        # The client socket is non-blocking for the read notifier; a multi-megabyte render
+        # response outruns the kernel send buffer and sendall() would raise BlockingIOError
+        self.client.settimeout(SEND_TIMEOUT)
+        try:
+            for chunk in chunks:
+                self.client.sendall(chunk)
+        finally:
+            self.client.setblocking(False)
 
     # -------------------------------------------------------------------------
     # Command Handling
@@ -139,83 +309,54 @@ class HoudiniMCPServer:
     def execute_command(self, command):
         """Entry point for executing a JSON command from the client."""
         try:
-            cmd_type = command.get("type", "")
-            if cmd_type in self.MUTATING_COMMANDS:
-                with hou.undos.group(f"MCP: {cmd_type}"):
+            cmd_type = command.get("type")
+            if cmd_type in self._SCENE_CHANGING_COMMANDS:
+                invalidate_scene_info()
+            undo_label = self._UNDO_LABELS.get(cmd_type)
+            if undo_label is not None:
+                with hou.undos.group(undo_label):
                     return self._execute_command_internal(command)
             else:
                 return self._execute_command_internal(command)
         except Exception as e:
-            print(f"Error executing command: {str(e)}")
-            traceback.print_exc()
+            # The message goes back to the client; only format the traceback when debugging
+            logger.warning("Error executing command: %s", e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"status": "error", "message": str(e)}
 
     def _get_handlers(self):
-        """Return the command handler dispatch dict."""
-        handlers = {
-            "ping": self.ping,
-            "get_scene_info": get_scene_info,
-            "create_node": create_node,
-            "modify_node": modify_node,
-            "delete_node": delete_node,
-            "get_node_info": get_node_info,
-            "execute_code": execute_code,
-            "set_material": set_material,
-            "get_asset_lib_status": get_asset_lib_status,
-            "connect_nodes": connect_nodes,
-            "disconnect_node_input": disconnect_node_input,
-            "set_node_flags": set_node_flags,
-            "save_scene": save_scene,
-            "load_scene": load_scene,
-            "set_expression": set_expression,
-            "set_frame": set_frame,
-            "get_geo_summary": get_geo_summary,
-            "geo_export": geo_export,
-            "layout_children": layout_children,
-            "set_node_color": set_node_color,
-            "find_error_nodes": find_error_nodes,
-            "pdg_cook": pdg_cook,
-            "pdg_status": pdg_status,
-            "pdg_workitems": pdg_workitems,
-            "pdg_dirty": pdg_dirty,
-            "pdg_cancel": pdg_cancel,
-            "lop_stage_info": lop_stage_info,
-            "lop_prim_get": lop_prim_get,
-            "lop_prim_search": lop_prim_search,
-            "lop_layer_info": lop_layer_info,
-            "lop_import": lop_import,
-            "hda_list": hda_list,
-            "hda_get": hda_get,
-            "hda_install": hda_install,
-            "hda_create": hda_create,
-            "batch": self.batch,
-            "get_pending_events": self.get_pending_events,
-            "subscribe_events": self.subscribe_events,
-            "render_single_view": handle_render_single_view,
-            "render_quad_view": handle_render_quad_view,
-            "render_specific_camera": handle_render_specific_camera,
-            "render_flipbook": render_flipbook,
-        }
-        if getattr(hou.session, "houdinimcp_use_assetlib", False):
+        """Return the command handler dispatch dict, rebuilt only when the asset-lib toggle changes."""
+        use_assetlib = getattr(hou.session, "houdinimcp_use_assetlib", False)
+        if self._handlers is None or use_assetlib != self._handlers_use_assetlib:
+            handlers = dict(self._MODULE_HANDLERS)
             handlers.update({
-                "get_asset_categories": self.get_asset_categories,
-                "search_assets": self.search_assets,
-                "import_asset": self.import_asset,
+                "ping": self.ping,
+                "batch": self.batch,
+                "get_pending_events": self.get_pending_events,
+                "subscribe_events": self.subscribe_events,
             })
-        return handlers
+            if use_assetlib:
+                handlers.update({
+                    "get_asset_categories": self.get_asset_categories,
+                    "search_assets": self.search_assets,
+                    "import_asset": self.import_asset,
+                })
+            self._handlers = handlers
+            self._handlers_use_assetlib = use_assetlib
+        return self._handlers
 
     def _execute_command_internal(self, command):
         """Dispatch a JSON command to its handler."""
         cmd_type = command.get("type")
-        params = command.get("params", {})
-
         handler = self._get_handlers().get(cmd_type)
-        if not handler:
+        if handler is None:
             return {"status": "error", "message": f"Unknown command type: {cmd_type}"}
 
-        print(f"Executing handler for {cmd_type}")
+        params = command.get("params", {})
+
+        logger.debug("Executing handler for %s", cmd_type)
         result = handler(**params)
-        print(f"Handler execution complete for {cmd_type}")
+        logger.debug("Handler execution complete for %s", cmd_type)
         return {"status": "success", "result": result}
 
     # -------------------------------------------------------------------------
@@ -234,15 +375,21 @@ class HoudiniMCPServer:
     def batch(self, operations):
         """Execute multiple operations atomically. Each op: {type, params}."""
         handlers = self._get_handlers()
-        results = []
+        # Resolve every op up front so an unknown type fails before anything is mutated
+        calls = []
         for op in operations:
             cmd_type = op.get("type")
-            params = op.get("params", {})
             handler = handlers.get(cmd_type)
             if not handler:
                 raise ValueError(f"Unknown operation in batch: {cmd_type}")
-            result = handler(**params)
-            results.append({"type": cmd_type, "result": result})
+            calls.append((cmd_type, handler, op.get("params", {})))
+        results = []
+        with suppress_updates():
+            for cmd_type, handler, params in calls:
+                results.append({"type": cmd_type, "result": handler(**params)})
+                # A later get_scene_info in the same batch must see this op's changes
+                if cmd_type in self._SCENE_CHANGING_COMMANDS:
+                    invalidate_scene_info()
         return {"count": len(results), "results": results}
 
     def get_pending_events(self, since=None):
@@ -1,5 +1,6 @@
 """Shared fixtures for HoudiniMCP tests."""
 import json
+import select
 import socket
 import threading
 
@@ -9,8 +10,9 @@ import pytest
 class MockHoudiniServer:
     """Minimal TCP server that mimics Houdini's command protocol.
 
-    Accepts a JSON command, looks up a canned response by command type,
-    and sends it back.  Falls back to a generic success response.
+    Accepts length-prefixed JSON commands on a persistent connection, looks
+    up a canned response by command type, and sends it back framed the same
+    way.  Falls back to a generic success response.
     """
 
     def __init__(self, host="localhost", port=0):
@@ -19,6 +21,8 @@ class MockHoudiniServer:
         self.responses = {}  # type str -> dict
         self._server_sock = None
         self._thread = None
+        # stop() writes to _wake_w so the serve loop leaves select() immediately
+        self._wake_r, self._wake_w = socket.socketpair()
         self._running = False
 
     def set_response(self, cmd_type, response_dict):
@@ -29,7 +33,6 @@ class MockHoudiniServer:
         self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._server_sock.bind((self.host, self.port))
         self._server_sock.listen(1)
-        self._server_sock.settimeout(2.0)
         # Get the actual port assigned by the OS
         self.port = self._server_sock.getsockname()[1]
         self._running = True
@@ -38,44 +41,55 @@ class MockHoudiniServer:
 
     def _serve(self):
         while self._running:
+            readable, _, _ = select.select([self._server_sock, self._wake_r], [], [])
+            if self._wake_r in readable:
+                break
             try:
                 client, _ = self._server_sock.accept()
-            except socket.timeout:
-                continue
             except OSError:
                 break
 
             try:
                 client.settimeout(5.0)
-                data = b""
-                while True:
-                    chunk = client.recv(4096)
-                    if not chunk:
-                        break
-                    data += chunk
-                    try:
-                        command = json.loads(data.decode("utf-8"))
-                        break
-                    except json.JSONDecodeError:
-                        continue
-
-                cmd_type = command.get("type", "")
-                response = self.responses.get(cmd_type, {
-                    "status": "success",
-                    "result": {"echo": cmd_type},
-                })
-                client.sendall(json.dumps(response).encode("utf-8"))
+                # Like the plugin, serve successive commands until the client disconnects
+                while self._running:
+                    header = self._recv_exact(client, 4)
+                    payload = self._recv_exact(client, int.from_bytes(header, "big"))
+                    command = json.loads(payload)
+                    cmd_type = command.get("type", "")
+                    response = self.responses.get(cmd_type, {
+                        "status": "success",
+                        "result": {"echo": cmd_type},
+                    })
+                    payload = json.dumps(response).encode("utf-8")
+                    client.sendall(len(payload).to_bytes(4, "big") + payload)
             except Exception:
                 pass
             finally:
                 client.close()
 
+    @staticmethod
+    def _recv_exact(client, size):
+        """Read exactly size bytes into one preallocated buffer."""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            n = client.recv_into(view[received:])
+            if not n:
+                raise ConnectionError("Client closed mid-message")
+            received += n
+        return buf
+
     def stop(self):
         self._running = False
-        if self._server_sock:
-            self._server_sock.close()
+        self._wake_w.send(b"x")
         if self._thread:
             self._thread.join(timeout=5)
+        if self._server_sock:
+            self._server_sock.close()
+        self._wake_r.close()
+        self._wake_w.close()
 
 
 @pytest.fixture
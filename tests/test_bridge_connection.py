@@ -96,6 +96,18 @@ class TestHoudiniConnection:
         assert result["result"]["echo"] == "nonexistent_command"
         conn.disconnect()
 
+    def test_commands_reuse_one_socket(self, mock_houdini_server):
+        conn = _make_connection(mock_houdini_server.port)
+        try:
+            conn.connect()
+            sock = conn.sock
+            for cmd_type in ("first", "second"):
+                result = conn.send_command(cmd_type)
+                assert result["result"]["echo"] == cmd_type
+            assert conn.sock is sock
+        finally:
+            conn.disconnect()
+
     def test_connection_error_returns_error_dict(self):
         """Connecting to a port with nothing listening returns an error dict."""
         conn = _make_connection(19999)
@@ -111,6 +123,12 @@ class TestHoudiniConnection:
         conn.disconnect()
         assert conn.sock is None
 
+    def test_connect_disables_nagle(self, mock_houdini_server):
+        conn = _make_connection(mock_houdini_server.port)
+        conn.connect()
+        assert conn.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+        conn.disconnect()
+
     def test_get_status_disconnected(self):
         conn = _make_connection(19999)
         status = conn.get_status()
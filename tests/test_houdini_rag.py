@@ -75,6 +75,19 @@ class TestBM25Index:
         results = self.index.search("karma renderer")
         assert results[0]["path"] == "lop/karma.md"
 
+    def test_repeated_search_cached_and_isolated(self):
+        first = self.index.search("karma renderer")
+        first[0]["path"] = "mutated"
+        second = self.index.search("karma renderer")
+        assert second[0]["path"] == "lop/karma.md"
+        assert len(self.index._search_cache) == 1
+
+    def test_build_clears_search_cache(self):
+        self.index.search("box")
+        self.index.add_document("sop/box2.md", "Box 2", "Another box")
+        self.index.build()
+        assert len(self.index.search("box")) == 2
+
     def test_search_top_k(self):
         results = self.index.search("primitive geometry", top_k=1)
         assert len(results) == 1
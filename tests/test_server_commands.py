@@ -3,8 +3,11 @@
 These tests mock the `hou` module and other Houdini-only deps since
 server.py normally runs inside the Houdini process.
 """
+import importlib.util
+import json
+import select
+import socket
 import sys
-import os
 import types
 
 import pytest
@@ -68,6 +71,9 @@ _obj_node = types.SimpleNamespace(
 _orig_hou_node = _hou_mock.node
 _hou_mock.node = lambda path: _obj_node if path == "/obj" else None
 _hou_mock.setFrame = lambda f: None
+_hou_mock.updateMode = types.SimpleNamespace(AutoUpdate="AutoUpdate", Manual="Manual")
+_hou_mock.updateModeSetting = lambda: _hou_mock.updateMode.AutoUpdate
+_hou_mock.setUpdateMode = lambda mode: None
 _hou_mock.exprLanguage = types.SimpleNamespace(
     Hscript=0,
     Python=1,
@@ -93,36 +99,68 @@ _hou_mock.LopSelectionRule = type("LopSelectionRule", (), {
 sys.modules["hou"] = _hou_mock
 
 # Mock PySide2
-for mod_name in ["PySide2", "PySide2.QtWidgets", "PySide2.QtCore", "PySide2.QtGui"]:
-    if mod_name not in sys.modules:
-        sys.modules[mod_name] = types.ModuleType(mod_name)
+_pyside_mods = ("PySide2", "PySide2.QtWidgets", "PySide2.QtCore", "PySide2.QtGui")
+sys.modules.update({n: types.ModuleType(n) for n in _pyside_mods if n not in sys.modules})
 
 _qtcore = sys.modules["PySide2.QtCore"]
 
-class _MockQTimer:
-    def __init__(self):
+class _MockQSocketNotifier:
+    Read = 0
+
+    def __init__(self, fd, kind):
         self._callback = None
-    def timeout_connect(self, cb):
+        self.deleted = False
+        self.activated = types.SimpleNamespace(connect=self._connect)
+    def _connect(self, cb):
         self._callback = cb
-    @property
-    def timeout(self):
-        return types.SimpleNamespace(connect=self.timeout_connect)
-    def start(self, ms):
-        pass
-    def stop(self):
+    def setEnabled(self, enabled):
         pass
+    def deleteLater(self):
+        self.deleted = True
 
-_qtcore.QTimer = _MockQTimer
+_qtcore.QSocketNotifier = _MockQSocketNotifier
 
-# Mock numpy (used by HoudiniMCPRender.py)
-_numpy_mock = types.ModuleType("numpy")
-_numpy_mock.array = lambda *a, **kw: a[0] if a else []
-_numpy_mock.isinf = lambda x: types.SimpleNamespace(any=lambda: False)
-sys.modules["numpy"] = _numpy_mock
+# Mock numpy (imported by HoudiniMCPRender.py at load time) only if it is missing,
+# so a real numpy pulled in by other libraries is never shadowed
+if importlib.util.find_spec("numpy") is None:
+    _numpy_mock = types.ModuleType("numpy")
+    _numpy_mock.array = lambda *a, **kw: a[0] if a else []
+    _numpy_mock.isinf = lambda x: types.SimpleNamespace(any=lambda: False)
+    sys.modules["numpy"] = _numpy_mock
 
 # ---------- Now import the server ----------
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
-from houdinimcp.server import HoudiniMCPServer
+from houdinimcp.server import HoudiniMCPServer, SEND_TIMEOUT
+
+
+def _wait_readable(sock, timeout=2.0):
+    """Block until sock is readable, as the Qt notifier would signal, or fail."""
+    readable, _, _ = select.select([sock], [], [], timeout)
+    assert readable, "socket did not become readable"
+
+
+_EXPECTED_HANDLERS = (
+    "ping", "get_scene_info", "create_node", "modify_node",
+    "delete_node", "delete_nodes", "get_node_info", "execute_code", "set_material",
+    "connect_nodes", "disconnect_node_input", "set_node_flags",
+    "save_scene", "load_scene", "set_expression", "set_frame",
+    "get_geo_summary", "geo_export", "layout_children", "set_node_color",
+    "find_error_nodes", "pdg_cook", "pdg_status", "pdg_workitems",
+    "pdg_dirty", "pdg_cancel", "lop_stage_info", "lop_prim_get",
+    "lop_prim_search", "lop_layer_info", "lop_import",
+    "hda_list", "hda_get", "hda_install", "hda_create",
+    "batch", "get_pending_events", "subscribe_events",
+    "render_single_view", "render_quad_view",
+    "render_specific_camera", "render_flipbook",
+)
+
+_EXPECTED_MUTATING = frozenset({
+    "create_node", "modify_node", "delete_node", "delete_nodes", "execute_code",
+    "set_material", "connect_nodes", "disconnect_node_input",
+    "set_node_flags", "save_scene", "load_scene", "set_expression",
+    "set_frame", "layout_children", "set_node_color",
+    "pdg_cook", "pdg_dirty", "pdg_cancel",
+    "lop_import", "hda_install", "hda_create", "batch",
+})
 
 
 class TestCommandDispatcher:
@@ -133,8 +171,13 @@ class TestCommandDispatcher:
         self.server.running = False
         self.server.socket = None
         self.server.client = None
-        self.server.buffer = b""
-        self.server.timer = None
+        self.server.buffer = bytearray()
+        self.server.accept_notifier = None
+        self.server.read_notifier = None
+        ping = json.dumps({"status": "success", "result": {
+            "alive": True, "host": "localhost", "port": 9876, "has_client": True,
+        }}).encode("utf-8")
+        self.server._ping_frame = len(ping).to_bytes(4, "big") + ping
         from houdinimcp.event_collector import EventCollector
         self.server.event_collector = EventCollector()
 
@@ -150,15 +193,8 @@ class TestCommandDispatcher:
 
     def test_mutating_commands_set(self):
         """Verify MUTATING_COMMANDS contains the expected commands."""
-        expected = {
-            "create_node", "modify_node", "delete_node", "execute_code",
-            "set_material", "connect_nodes", "disconnect_node_input",
-            "set_node_flags", "save_scene", "load_scene", "set_expression",
-            "set_frame", "layout_children", "set_node_color",
-            "pdg_cook", "pdg_dirty", "pdg_cancel",
-            "lop_import", "hda_install", "hda_create", "batch",
-        }
-        assert expected == HoudiniMCPServer.MUTATING_COMMANDS
+        assert HoudiniMCPServer.MUTATING_COMMANDS == _EXPECTED_MUTATING
+        assert set(HoudiniMCPServer._UNDO_LABELS) == _EXPECTED_MUTATING
 
     def test_ping_handler_fields(self):
         result = self.server.ping()
@@ -168,14 +204,15 @@ class TestCommandDispatcher:
         assert result["alive"] is True
         assert result["port"] == 9876
 
-    def test_dangerous_code_blocked(self):
-        """execute_code should reject dangerous patterns by default."""
+    @pytest.mark.parametrize("pattern", HoudiniMCPServer.DANGEROUS_PATTERNS)
+    def test_dangerous_code_blocked(self, pattern):
+        """execute_code should reject every dangerous pattern by default."""
         result = self.server.execute_command({
             "type": "execute_code",
-            "params": {"code": "import os; os.remove('/tmp/foo')"},
+            "params": {"code": f"x = 1\n{pattern}('/tmp/foo')"},
         })
         assert result["status"] == "error"
-        assert "Dangerous pattern" in result["message"]
+        assert f"Dangerous pattern detected: '{pattern}'" in result["message"]
 
     def test_dangerous_code_allowed(self):
         """execute_code with allow_dangerous=True should proceed."""
@@ -195,23 +232,24 @@ class TestCommandDispatcher:
         assert result["status"] == "success"
         assert result["result"]["executed"] is True
 
-    def test_set_frame_dispatches(self):
-        """set_frame should call through the dispatcher."""
-        result = self.server.execute_command({
-            "type": "set_frame",
-            "params": {"frame": 10},
-        })
-        assert result["status"] == "success"
-        assert result["result"]["frame"] == 10
-
-    def test_save_scene_dispatches(self):
-        """save_scene should return saved status."""
+    def test_repeated_code_compiled_once(self):
+        """The same snippet reuses its code object but still runs in a fresh namespace."""
+        from houdinimcp.handlers import code
+        code._compile_code.cache_clear()
+        snippet = "print('seen' if 'y' in globals() else 'fresh'); y = 1"
+        for _ in range(2):
+            result = self.server.execute_command({
+                "type": "execute_code", "params": {"code": snippet},
+            })
+            assert result["result"]["stdout"] == "fresh\n"
+        assert code._compile_code.cache_info().hits == 1
+
+    def test_syntax_error_reported(self):
         result = self.server.execute_command({
-            "type": "save_scene",
-            "params": {},
+            "type": "execute_code", "params": {"code": "x = ("},
         })
-        assert result["status"] == "success"
-        assert result["result"]["saved"] is True
+        assert result["status"] == "error"
+        assert "Code execution error" in result["message"]
 
     def test_dangerous_patterns_list(self):
         """Verify all expected dangerous patterns are in the list."""
@@ -243,34 +281,126 @@ class TestCommandDispatcher:
         assert result["status"] == "error"
         assert "Unknown operation" in result["message"]
 
-    def test_hda_list_dispatches(self):
-        """hda_list should return without error (empty with mocked hou)."""
+    def test_batch_unknown_op_fails_before_executing(self, monkeypatch):
+        """An unknown op later in the batch prevents earlier ops from running."""
+        frames = []
+        monkeypatch.setattr(_hou_mock, "setFrame", frames.append)
         result = self.server.execute_command({
-            "type": "hda_list",
-            "params": {},
+            "type": "batch",
+            "params": {"operations": [
+                {"type": "set_frame", "params": {"frame": 5}},
+                {"type": "nonexistent_op", "params": {}},
+            ]},
+        })
+        assert result["status"] == "error"
+        assert frames == []
+
+    def test_batch_restores_update_mode(self, monkeypatch):
+        """Batch runs in manual update mode and restores it even on failure."""
+        modes = []
+        monkeypatch.setattr(_hou_mock, "setUpdateMode", modes.append)
+        self.server.execute_command({
+            "type": "batch",
+            "params": {"operations": [{"type": "set_frame", "params": {}}]},
         })
+        assert modes == ["Manual", "AutoUpdate"]
+
+    def test_process_messages_handles_framing(self):
+        """Complete frames are executed; a trailing partial frame stays buffered."""
+        sent = []
+        self.server.client = types.SimpleNamespace(  # no sendmsg: Windows path
+            sendall=sent.append, settimeout=lambda t: None, setblocking=lambda flag: None,
+        )
+        ping = json.dumps({"type": "ping"}).encode("utf-8")
+        frame = len(ping).to_bytes(4, "big") + ping
+        self.server.buffer.extend(frame + frame + frame[:6])
+        self.server._process_messages()
+        assert sent == [self.server._ping_frame] * 2
+        assert self.server.buffer == frame[:6]
+
+    def test_process_messages_non_object_payload_gets_error(self):
+        """Valid JSON that is not an object is answered with an error, not a dropped client."""
+        sent = []
+        self.server.client = types.SimpleNamespace(
+            sendall=lambda data: sent.append(bytes(data)),
+            settimeout=lambda t: None, setblocking=lambda flag: None,
+        )
+        payload = b"[]"
+        self.server.buffer.extend(len(payload).to_bytes(4, "big") + payload)
+        self.server._process_messages()
+        length = int.from_bytes(sent[0], "big")
+        assert json.loads(sent[1][:length])["status"] == "error"
+        assert self.server.client is not None
+
+    def test_process_messages_drops_oversized_message(self):
+        """A declared length over the cap closes the client without waiting for the body."""
+        closed = []
+        self.server.client = types.SimpleNamespace(close=lambda: closed.append(True))
+        notifier = _MockQSocketNotifier(0, _MockQSocketNotifier.Read)
+        self.server.read_notifier = notifier
+        length = self.server.MAX_MESSAGE_BYTES + 1
+        self.server.buffer.extend(length.to_bytes(4, "big") + b"{")
+        self.server._process_messages()
+        assert closed == [True]
+        assert self.server.client is None
+        assert notifier.deleted  # handed to Qt, not destroyed mid-signal
+        assert self.server.buffer == b""
+
+    def test_send_frame_completes_partial_sendmsg(self):
+        sent = []
+        self.server.client = types.SimpleNamespace(
+            sendmsg=lambda buffers: 2,
+            sendall=lambda data: sent.append(bytes(data)),
+            settimeout=lambda t: None,
+            setblocking=lambda flag: None,
+        )
+        self.server._send_frame(b"payload")
+        assert sent == [(7).to_bytes(4, "big")[2:], b"payload"]
+
+    def test_send_frame_blocks_when_send_buffer_full(self):
+        """A full kernel buffer switches to a timed blocking send, then back to non-blocking."""
+        calls = []
+
+        def sendmsg(buffers):
+            raise BlockingIOError
+
+        self.server.client = types.SimpleNamespace(
+            sendmsg=sendmsg,
+            sendall=lambda data: calls.append(("sendall", bytes(data))),
+            settimeout=lambda t: calls.append(("settimeout", t)),
+            setblocking=lambda flag: calls.append(("setblocking", flag)),
+        )
+        self.server._send_frame(b"payload")
+        assert calls == [
+            ("settimeout", SEND_TIMEOUT),
+            ("sendall", (7).to_bytes(4, "big")),
+            ("sendall", b"payload"),
+            ("setblocking", False),
+        ]
+
+    @pytest.mark.parametrize("cmd", _EXPECTED_HANDLERS)
+    def test_handler_registered(self, cmd):
+        assert cmd in self.server._get_handlers()
+
+    @pytest.mark.parametrize("cmd_type,params,key,expected", [
+        ("set_frame", {"frame": 10}, "frame", 10),
+        ("save_scene", {}, "saved", True),
+        ("hda_list", {}, "count", 0),  # empty with mocked hou
+        ("subscribe_events", {"types": ["scene_saved", "node_created"]},
+         "subscribed", ["scene_saved", "node_created"]),
+        ("subscribe_events", {}, "subscribed", "all"),
+    ])
+    def test_simple_dispatch(self, cmd_type, params, key, expected):
+        result = self.server.execute_command({"type": cmd_type, "params": params})
         assert result["status"] == "success"
-        assert result["result"]["count"] == 0
+        assert result["result"][key] == expected
 
-    def test_all_handlers_registered(self):
-        """Every expected command type should have a handler."""
+    def test_handlers_cached_until_assetlib_toggles(self, monkeypatch):
         handlers = self.server._get_handlers()
-        expected = [
-            "ping", "get_scene_info", "create_node", "modify_node",
-            "delete_node", "get_node_info", "execute_code", "set_material",
-            "connect_nodes", "disconnect_node_input", "set_node_flags",
-            "save_scene", "load_scene", "set_expression", "set_frame",
-            "get_geo_summary", "geo_export", "layout_children", "set_node_color",
-            "find_error_nodes", "pdg_cook", "pdg_status", "pdg_workitems",
-            "pdg_dirty", "pdg_cancel", "lop_stage_info", "lop_prim_get",
-            "lop_prim_search", "lop_layer_info", "lop_import",
-            "hda_list", "hda_get", "hda_install", "hda_create",
-            "batch", "get_pending_events", "subscribe_events",
-            "render_single_view", "render_quad_view",
-            "render_specific_camera", "render_flipbook",
-        ]
-        for cmd in expected:
-            assert cmd in handlers, f"Handler not registered: {cmd}"
+        assert self.server._get_handlers() is handlers
+        assert "search_assets" not in handlers
+        monkeypatch.setattr(_hou_mock.session, "houdinimcp_use_assetlib", True)
+        assert "search_assets" in self.server._get_handlers()
 
     def test_get_pending_events_dispatches(self):
         """get_pending_events should return empty events list."""
@@ -282,20 +412,345 @@ class TestCommandDispatcher:
         assert result["result"]["count"] == 0
         assert result["result"]["events"] == []
 
-    def test_subscribe_events_dispatches(self):
-        """subscribe_events should accept a type filter."""
-        result = self.server.execute_command({
-            "type": "subscribe_events",
-            "params": {"types": ["scene_saved", "node_created"]},
-        })
+    def test_accept_and_read_round_trip(self):
+        server = HoudiniMCPServer(port=0)
+        server.start()
+        try:
+            port = server.socket.getsockname()[1]
+            client = socket.create_connection(("localhost", port))
+            _wait_readable(server.socket)
+            server._on_accept()
+            assert server.client is not None
+            payload = json.dumps({"type": "ping"}).encode("utf-8")
+            client.sendall(len(payload).to_bytes(4, "big") + payload)
+            _wait_readable(server.client)
+            server._on_client_readable()
+            client.settimeout(2.0)
+            data = client.recv(65536)
+            length = int.from_bytes(data[:4], "big")
+            assert json.loads(data[4:4 + length])["result"]["alive"] is True
+            client.close()
+            _wait_readable(server.client)
+            server._on_client_readable()
+            assert server.client is None
+        finally:
+            server.stop()
+
+
+class _FakeParm:
+    def __init__(self, value):
+        self.value = value
+        self.set_calls = 0
+
+    def eval(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        self.set_calls += 1
+
+
+class TestNodeHandlers:
+    def test_modify_node_skips_unchanged_parms(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+        parms = {"tx": _FakeParm(1.0), "ty": _FakeParm(0.0)}
+        set_parms_calls = []
+        node = types.SimpleNamespace(
+            name=lambda: "box1",
+            path=lambda: "/obj/box1",
+            parm=parms.get,
+            setParms=set_parms_calls.append,
+        )
+        monkeypatch.setattr(_hou_mock, "node", lambda path: node)
+        result = nodes.modify_node(
+            "/obj/box1", parameters={"tx": 1.0, "ty": 2.0, "missing": 5},
+        )
+        assert set_parms_calls == [{"ty": 2.0}]
+        assert result["changes"] == ["Parameter ty changed from 0.0 to 2.0"]
+
+    def test_get_node_info_limits_parms_without_flags(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+
+        def make_parm(i):
+            template_type = types.SimpleNamespace(name=lambda: "Float")
+            return types.SimpleNamespace(
+                name=lambda: f"p{i}", label=lambda: f"P{i}", eval=lambda: i,
+                rawValue=lambda: str(i),
+                parmTemplate=lambda: types.SimpleNamespace(type=lambda: template_type),
+            )
+
+        category = types.SimpleNamespace(name=lambda: "Vop")
+        node = types.SimpleNamespace(  # no isDisplayFlagSet/isRenderFlagSet, like a VOP
+            name=lambda: "add1", path=lambda: "/mat/add1",
+            type=lambda: types.SimpleNamespace(name=lambda: "add", category=lambda: category),
+            position=lambda: (1.0, 2.0), color=lambda: None, isBypassed=lambda: False,
+            parms=lambda: [make_parm(i) for i in range(50)],
+            inputs=lambda: [], outputConnections=lambda: [],
+        )
+        monkeypatch.setattr(_hou_mock, "node", lambda path: node)
+        info = nodes.get_node_info("/mat/add1", max_parms=5)
+        assert [p["name"] for p in info["parameters"]] == ["p0", "p1", "p2", "p3", "p4"]
+        assert info["is_displayed"] is None and info["is_rendered"] is None
+        assert info["position"] == [1.0, 2.0]
+
+    def test_find_error_nodes_stops_at_max_results(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+        warning_calls = []
+
+        def make_node(i, errors, warnings):
+            def node_warnings():
+                warning_calls.append(i)
+                return warnings
+            return types.SimpleNamespace(
+                path=lambda: f"/obj/n{i}",
+                type=lambda: types.SimpleNamespace(name=lambda: "geo"),
+                errors=lambda: errors,
+                warnings=node_warnings,
+            )
+
+        children = [
+            make_node(0, ["bad"], []),
+            make_node(1, [], []),
+            make_node(2, [], ["meh"]),
+            make_node(3, ["bad"], []),
+        ]
+        root = types.SimpleNamespace(allSubChildren=lambda: children)
+        monkeypatch.setattr(_hou_mock, "node", lambda path: root)
+        result = nodes.find_error_nodes("/obj", max_results=2)
+        assert result["nodes"] == [
+            {"path": "/obj/n0", "type": "geo", "errors": ["bad"]},
+            {"path": "/obj/n2", "type": "geo", "warnings": ["meh"]},
+        ]
+        assert result["truncated"] is True
+        assert warning_calls == [1, 2]  # never asked of nodes that have errors
+
+    def test_delete_nodes_groups_by_parent(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+        deleted_calls = []
+
+        def make_node(path):
+            return types.SimpleNamespace(
+                path=lambda: path,
+                parent=lambda: make_node(path.rsplit("/", 1)[0]),
+                deleteItems=lambda items: deleted_calls.append((path, list(items))),
+            )
+
+        monkeypatch.setattr(_hou_mock, "node", make_node)
+        result = nodes.delete_nodes(["/obj/geo1/a", "/obj/geo1/b", "/obj/geo2/c"])
+        assert result["count"] == 3
+        assert [parent for parent, _ in deleted_calls] == ["/obj/geo1", "/obj/geo2"]
+        assert len(deleted_calls[0][1]) == 2
+
+    def test_delete_nodes_skips_descendants_and_duplicates(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+        deleted_calls = []
+        live = {"/obj", "/obj/geo1", "/obj/geo1/box1", "/obj/geo2"}
+
+        def make_node(path):
+            if path not in live:
+                return None
+
+            def delete_items(items):
+                deleted_calls.append((path, [n.path() for n in items]))
+                for n in items:
+                    live.difference_update(
+                        p for p in list(live) if p == n.path() or p.startswith(n.path() + "/"))
+            return types.SimpleNamespace(
+                path=lambda: path,
+                parent=lambda: make_node(path.rsplit("/", 1)[0]),
+                deleteItems=delete_items,
+            )
+
+        monkeypatch.setattr(_hou_mock, "node", make_node)
+        result = nodes.delete_nodes(
+            ["/obj/geo1", "/obj/geo1/box1", "/obj/geo2", "/obj/geo1"])
+        assert deleted_calls == [("/obj", ["/obj/geo1", "/obj/geo2"])]
+        assert result == {"deleted": ["/obj/geo1", "/obj/geo2"], "count": 2}
+
+    def test_set_node_flags_skips_matching_flags(self, monkeypatch):
+        from houdinimcp.handlers import nodes
+        writes = []
+        node = types.SimpleNamespace(
+            path=lambda: "/obj/geo1",
+            isDisplayFlagSet=lambda: True,
+            isRenderFlagSet=lambda: False,
+            isBypassed=lambda: False,
+            setDisplayFlag=lambda v: writes.append(("display", v)),
+            setRenderFlag=lambda v: writes.append(("render", v)),
+            bypass=lambda v: writes.append(("bypass", v)),
+        )
+        monkeypatch.setattr(_hou_mock, "node", lambda path: node)
+        result = nodes.set_node_flags("/obj/geo1", display=True, render=True, bypass=False)
+        assert writes == [("render", True)]
+        assert result["changes"] == ["render=True"]
+
+
+class TestRenderedImage:
+    def test_return_image_false_skips_encoding(self, tmp_path):
+        from houdinimcp.handlers.rendering import _process_rendered_image
+        image = tmp_path / "MCP_OGL_RENDER_front_ortho.jpg"
+        image.write_bytes(b"\xff\xd8\xff")
+        result = _process_rendered_image(str(image), return_image=False)
         assert result["status"] == "success"
-        assert result["result"]["subscribed"] == ["scene_saved", "node_created"]
-
-    def test_subscribe_events_all(self):
-        """subscribe_events with no types = subscribe to all."""
-        result = self.server.execute_command({
-            "type": "subscribe_events",
-            "params": {},
-        })
+        assert result["image_base64"] is None
+        assert result["filepath_on_server"] == str(image)
+
+    def test_empty_render_file_is_an_error(self, tmp_path):
+        from houdinimcp.handlers.rendering import _process_rendered_image
+        image = tmp_path / "render.jpg"
+        image.write_bytes(b"")
+        for return_image in (True, False):
+            result = _process_rendered_image(str(image), return_image=return_image)
+            assert result["status"] == "error"
+            assert result["message"] == f"Rendered file is empty: {image}"
+
+    def test_return_image_default_encodes(self, tmp_path):
+        from houdinimcp.handlers.rendering import _process_rendered_image
+        image = tmp_path / "render.jpg"
+        image.write_bytes(b"\xff\xd8\xff")
+        result = _process_rendered_image(str(image))
+        assert result["image_base64"] == "/9j/"
+        assert result["format"] == "jpg"
+
+    def test_quad_view_uses_renderer_view_names(self, monkeypatch, tmp_path):
+        from houdinimcp.handlers import rendering
+        image = tmp_path / "MCP_OGL_RENDER_front_ortho.jpg"
+        image.write_bytes(b"\xff\xd8\xff")
+        monkeypatch.setattr(rendering, "render_quad_view",
+                            lambda **kwargs: [(str(image), "front")])
+        result = rendering.handle_render_quad_view(return_image=False)
         assert result["status"] == "success"
-        assert result["result"]["subscribed"] == "all"
+        assert result["results"][0]["view_name"] == "front"
+
+    def test_render_failure_returns_error_dict(self, monkeypatch):
+        from houdinimcp.handlers import rendering
+
+        def fail(**kwargs):
+            raise RuntimeError("no /out context")
+
+        monkeypatch.setattr(rendering, "render_quad_view", fail)
+        result = rendering.handle_render_quad_view()
+        assert result == {
+            "status": "error",
+            "message": "Render Quad View Failed: no /out context",
+            "origin": "handle_render_quad_view",
+        }
+
+    def test_missing_file_reported(self, tmp_path):
+        from houdinimcp.handlers.rendering import _process_rendered_image
+        missing = str(tmp_path / "missing.png")
+        for return_image in (True, False):
+            result = _process_rendered_image(missing, return_image=return_image)
+            assert result["status"] == "error"
+            assert "not found" in result["message"]
+
+
+class TestSceneInfoCache:
+    def _patch_root(self, monkeypatch, calls):
+        def all_sub_children():
+            calls.append(1)
+            return []
+        root = types.SimpleNamespace(
+            allSubChildren=all_sub_children,
+            node=lambda name: None,
+        )
+        monkeypatch.setattr(_hou_mock, "node", lambda path: root)
+
+    def test_repeated_calls_hit_cache(self, monkeypatch):
+        from houdinimcp.handlers import scene
+        calls = []
+        self._patch_root(monkeypatch, calls)
+        scene.invalidate_scene_info()
+        first = scene.get_scene_info(include_node_count=True)
+        first["name"] = "edited by caller"
+        first["nodes"].append({"name": "bogus"})
+        second = scene.get_scene_info(include_node_count=True)
+        assert second["name"] == "untitled.hip"
+        assert second["nodes"] == []
+        assert len(calls) == 1
+        scene.invalidate_scene_info()
+
+    def test_mutating_command_invalidates_cache(self, monkeypatch):
+        from houdinimcp.handlers import scene
+        calls = []
+        self._patch_root(monkeypatch, calls)
+        scene.invalidate_scene_info()
+        server = HoudiniMCPServer.__new__(HoudiniMCPServer)
+        scene.get_scene_info(include_node_count=True)
+        server.execute_command({"type": "set_frame", "params": {"frame": 3}})
+        scene.get_scene_info(include_node_count=True)
+        assert len(calls) == 2
+        scene.invalidate_scene_info()
+
+    def test_render_command_invalidates_cache(self, monkeypatch):
+        from houdinimcp.handlers import rendering, scene
+        calls = []
+        self._patch_root(monkeypatch, calls)
+        monkeypatch.setattr(rendering, "render_single_view", lambda **kwargs: None)
+        scene.invalidate_scene_info()
+        server = HoudiniMCPServer.__new__(HoudiniMCPServer)
+        scene.get_scene_info(include_node_count=True)
+        server.execute_command({"type": "render_single_view", "params": {}})
+        scene.get_scene_info(include_node_count=True)
+        assert len(calls) == 2
+        scene.invalidate_scene_info()
+
+    def test_batch_op_invalidates_cache_for_later_ops(self, monkeypatch):
+        from houdinimcp.handlers import scene
+        obj_children = []
+
+        def make_child(name):
+            return types.SimpleNamespace(
+                name=lambda: name, path=lambda: f"/obj/{name}",
+                type=lambda: types.SimpleNamespace(name=lambda: "geo"),
+            )
+
+        obj = types.SimpleNamespace(children=lambda: list(obj_children))
+        root = types.SimpleNamespace(node=lambda name: obj if name == "obj" else None)
+        monkeypatch.setattr(_hou_mock, "node", lambda path: root)
+        monkeypatch.setitem(HoudiniMCPServer._MODULE_HANDLERS, "create_node",
+                            lambda node_type, name: obj_children.append(make_child(name)))
+        scene.invalidate_scene_info()
+        server = HoudiniMCPServer.__new__(HoudiniMCPServer)
+        result = server.execute_command({"type": "batch", "params": {"operations": [
+            {"type": "get_scene_info"},
+            {"type": "create_node", "params": {"node_type": "geo", "name": "geo1"}},
+            {"type": "get_scene_info"},
+        ]}})
+        before, _, after = result["result"]["results"]
+        assert before["result"]["nodes"] == []
+        assert [n["name"] for n in after["result"]["nodes"]] == ["geo1"]
+        scene.invalidate_scene_info()
+
+    def test_node_count_skipped_by_default(self, monkeypatch):
+        from houdinimcp.handlers import scene
+        calls = []
+        self._patch_root(monkeypatch, calls)
+        scene.invalidate_scene_info()
+        info = scene.get_scene_info()
+        assert info["node_count"] is None
+        assert calls == []
+        scene.invalidate_scene_info()
+
+    def test_top_nodes_capped_across_contexts(self, monkeypatch):
+        from houdinimcp.handlers import scene
+
+        def make_ctx(prefix, count):
+            return types.SimpleNamespace(children=lambda: [
+                types.SimpleNamespace(
+                    name=lambda i=i: f"{prefix}{i}",
+                    path=lambda i=i: f"/{prefix}/{prefix}{i}",
+                    type=lambda: types.SimpleNamespace(name=lambda: "geo"),
+                )
+                for i in range(count)
+            ])
+
+        contexts = {"obj": make_ctx("obj", 7), "out": make_ctx("out", 7)}
+        root = types.SimpleNamespace(node=contexts.get)
+        monkeypatch.setattr(_hou_mock, "node", lambda path: root)
+        scene.invalidate_scene_info()
+        info = scene.get_scene_info()
+        assert [n["name"] for n in info["nodes"]] == (
+            [f"obj{i}" for i in range(7)] + ["out0", "out1", "out2"])
+        assert (info["start_frame"], info["end_frame"]) == (1, 240)
+        scene.invalidate_scene_info()
@@ -1,32 +1,39 @@
 """Tests for claude_terminal.py — ANSI stripping and constants."""
-import ast
-import re
-import textwrap
+import functools
+import importlib.util
+import pathlib
 
 import pytest
 
+_PKG_DIR = pathlib.Path(__file__).parent.parent / "src" / "houdinimcp"
 
-# We can't import claude_terminal directly (needs PySide2), so test the pure
-# functions via AST extraction or regex reimplementation.
 
+@functools.lru_cache(maxsize=1)
+def _terminal_source():
+    """Read claude_terminal.py once; every test in this module inspects the same text."""
+    return (_PKG_DIR / "claude_terminal.py").read_text()
 
-def _extract_strip_ansi_regex():
-    """Extract the ANSI regex pattern from the source via AST."""
-    import pathlib
-    src = pathlib.Path(__file__).parent.parent / "src" / "houdinimcp" / "claude_terminal.py"
-    source = src.read_text()
-    # Find the _ANSI_RE pattern string
-    match = re.search(r"_ANSI_RE\s*=\s*re\.compile\(r'(.+?)'\)", source)
-    assert match, "Could not find _ANSI_RE in claude_terminal.py"
-    return re.compile(match.group(1))
+
+def _load_terminal_text():
+    """Load claude_terminal_text.py by path; importing the package needs hou."""
+    spec = importlib.util.spec_from_file_location(
+        "claude_terminal_text", _PKG_DIR / "claude_terminal_text.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+terminal_text = _load_terminal_text()
 
 
 class TestStripAnsi:
-    def setup_method(self):
-        self._ansi_re = _extract_strip_ansi_regex()
+    @pytest.fixture(autouse=True)
+    def _regex_fallback(self, monkeypatch):
+        # Exercise the regex path whether or not pyte is installed
+        monkeypatch.setattr(terminal_text, "_PYTE_AVAILABLE", False)
 
     def _strip(self, text):
-        return self._ansi_re.sub('', text)
+        return terminal_text.strip_ansi(text)
 
     def test_plain_text_unchanged(self):
         assert self._strip("hello world") == "hello world"
@@ -43,6 +50,10 @@ class TestStripAnsi:
     def test_removes_osc_sequences(self):
         assert self._strip("\x1b]0;window title\x07text") == "text"
 
+    def test_plain_text_skips_regex(self, monkeypatch):
+        monkeypatch.setattr(terminal_text, "_ANSI_RE", None)
+        assert self._strip("no escapes here") == "no escapes here"
+
     def test_empty_string(self):
         assert self._strip("") == ""
 
@@ -54,28 +65,12 @@ class TestStripAnsi:
 class TestTerminalConstants:
     """Verify constants are defined correctly in the source."""
 
-    def setup_method(self):
-        import pathlib
-        src = pathlib.Path(__file__).parent.parent / "src" / "houdinimcp" / "claude_terminal.py"
-        self._source = src.read_text()
-
-    def test_themes_defined(self):
-        assert "THEMES" in self._source
-        assert '"dark"' in self._source
-        assert '"light"' in self._source
-
-    def test_font_size_constants(self):
-        assert "DEFAULT_FONT_SIZE" in self._source
-        assert "MIN_FONT_SIZE" in self._source
-        assert "MAX_FONT_SIZE" in self._source
-
-    def test_scrollback_constant(self):
-        assert "DEFAULT_SCROLLBACK" in self._source
-
-    def test_classes_defined(self):
-        assert "class TerminalTab" in self._source
-        assert "class ClaudeTerminalWidget" in self._source
-        assert "class ConnectionStatusLED" in self._source
-
-    def test_create_panel_function(self):
-        assert "def create_panel" in self._source
+    @pytest.mark.parametrize("snippet", [
+        "THEMES", '"dark"', '"light"',
+        "DEFAULT_FONT_SIZE", "MIN_FONT_SIZE", "MAX_FONT_SIZE",
+        "DEFAULT_SCROLLBACK",
+        "class TerminalTab", "class ClaudeTerminalWidget", "class ConnectionStatusLED",
+        "def create_panel",
+    ])
+    def test_source_defines(self, snippet):
+        assert snippet in _terminal_source()